@@ -1,24 +1,46 @@
 from django.contrib import admin
+from django.forms.models import BaseInlineFormSet
+from django.urls import reverse
+from django.utils.html import format_html
 
 from .models import EmailRecipient, MessageJob, SMSRecipient
 
 
+class LimitedInlineFormSet(BaseInlineFormSet):
+    """Inline formset that only renders the first `limit` related rows."""
+
+    limit = 100
+
+    def get_queryset(self):
+        if not hasattr(self, '_limited_queryset'):
+            self._limited_queryset = super().get_queryset()[:self.limit]
+        return self._limited_queryset
+
+
 class EmailRecipientInline(admin.TabularInline):
     model = EmailRecipient
+    formset = LimitedInlineFormSet
     extra = 0
     readonly_fields = ['residence', 'email_address', 'status', 'error_message', 'sent_at']
     can_delete = False
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('residence')
+
     def has_add_permission(self, request, obj=None):
         return False
 
 
 class SMSRecipientInline(admin.TabularInline):
     model = SMSRecipient
+    formset = LimitedInlineFormSet
     extra = 0
     readonly_fields = ['residence', 'phone_number', 'status', 'error_message', 'sent_at']
     can_delete = False
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('residence')
+
     def has_add_permission(self, request, obj=None):
         return False
 
@@ -38,10 +60,21 @@ class MessageJobAdmin(admin.ModelAdmin):
         'email_total_recipients', 'email_sent_count', 'email_failed_count',
         'sms_total_recipients', 'sms_sent_count', 'sms_failed_count',
         'total_recipients', 'sent_count', 'failed_count',
-        'error_message', 'created_at', 'started_at', 'completed_at'
+        'error_message', 'created_at', 'started_at', 'completed_at', 'all_recipients'
     ]
     inlines = [EmailRecipientInline, SMSRecipientInline]
 
+    @admin.display(description='Recipients')
+    def all_recipients(self, obj):
+        return format_html(
+            '<a href="{}?job__id__exact={}">View all {} email recipients</a> / '
+            '<a href="{}?job__id__exact={}">View all {} SMS recipients</a> '
+            '(only the first {} of each are listed below)',
+            reverse('admin:messaging_emailrecipient_changelist'), obj.pk, obj.email_total_recipients,
+            reverse('admin:messaging_smsrecipient_changelist'), obj.pk, obj.sms_total_recipients,
+            LimitedInlineFormSet.limit,
+        )
+
     def has_add_permission(self, request):
         return False
 
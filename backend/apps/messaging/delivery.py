@@ -0,0 +1,64 @@
+"""
+Send-side helpers shared by the messaging workers: rate limiting and
+per-thread SMTP connection reuse.
+"""
+
+import threading
+import time
+
+from django.core.mail import get_connection
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket rate limiter.
+    Allows bursts of up to `capacity` sends and refills at `rate` per second.
+    """
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens=1):
+        """Block until `tokens` are available, then consume them."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait = (tokens - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class SMTPConnectionPool:
+    """
+    Gives each worker thread its own persistent SMTP connection.
+    Connections are opened lazily and stay open until close_all().
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections = []
+
+    def get(self):
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = get_connection()
+            connection.open()
+            self._local.connection = connection
+            with self._lock:
+                self._connections.append(connection)
+        return connection
+
+    def close_all(self):
+        with self._lock:
+            for connection in self._connections:
+                connection.close()
+            self._connections.clear()
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.9 on 2026-10-14 13:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('messaging', '0001_initial'),
+        ('residences', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='emailrecipient',
+            index=models.Index(fields=['job', 'status'], name='msg_email_rcpt_job_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='smsrecipient',
+            index=models.Index(fields=['job', 'status'], name='msg_sms_rcpt_job_status_idx'),
+        ),
+    ]
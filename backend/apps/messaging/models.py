@@ -82,6 +82,7 @@ class EmailRecipient(models.Model):
     """
     class Status(models.TextChoices):
         PENDING = 'pending', 'Pending'
+        SENDING = 'sending', 'Sending'  # Claimed by a batch whose results aren't written yet
         SENT = 'sent', 'Sent'
         FAILED = 'failed', 'Failed'
 
@@ -107,6 +108,10 @@ class EmailRecipient(models.Model):
     class Meta:
         db_table = 'message_email_recipients'
         ordering = ['id']
+        indexes = [
+            # Per-job status filters: pending batches, retry, finalize
+            models.Index(fields=['job', 'status'], name='msg_email_rcpt_job_status_idx'),
+        ]
 
     def __str__(self):
         return f"{self.email_address} - {self.status}"
@@ -118,6 +123,7 @@ class SMSRecipient(models.Model):
     """
     class Status(models.TextChoices):
         PENDING = 'pending', 'Pending'
+        SENDING = 'sending', 'Sending'  # Claimed by a batch whose results aren't written yet
         SENT = 'sent', 'Sent'
         FAILED = 'failed', 'Failed'
 
@@ -143,6 +149,10 @@ class SMSRecipient(models.Model):
     class Meta:
         db_table = 'message_sms_recipients'
         ordering = ['id']
+        indexes = [
+            # Per-job status filters: pending batches, retry, finalize
+            models.Index(fields=['job', 'status'], name='msg_sms_rcpt_job_status_idx'),
+        ]
 
     def __str__(self):
         return f"{self.phone_number} - {self.status}"
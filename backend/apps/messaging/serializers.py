@@ -32,11 +32,12 @@ class SMSRecipientSerializer(serializers.ModelSerializer):
 class MessageJobSerializer(serializers.ModelSerializer):
     """Serializer for job details (recipients fetched separately via endpoints)."""
     sender_email = serializers.EmailField(source='sender.email', read_only=True)
-    email_progress_percent = serializers.SerializerMethodField()
-    sms_progress_percent = serializers.SerializerMethodField()
-    overall_progress_percent = serializers.SerializerMethodField()
+    # Progress is annotated onto the queryset by the view
+    email_progress_percent = serializers.IntegerField(read_only=True)
+    sms_progress_percent = serializers.IntegerField(read_only=True)
+    overall_progress_percent = serializers.IntegerField(read_only=True)
     # Legacy field for backward compatibility
-    progress_percent = serializers.SerializerMethodField()
+    progress_percent = serializers.IntegerField(read_only=True)
 
     class Meta:
         model = MessageJob
@@ -64,23 +65,6 @@ class MessageJobSerializer(serializers.ModelSerializer):
             'overall_progress_percent', 'progress_percent'
         ]
 
-    def get_email_progress_percent(self, obj):
-        if obj.email_total_recipients == 0:
-            return 0
-        return int((obj.email_sent_count + obj.email_failed_count) / obj.email_total_recipients * 100)
-
-    def get_sms_progress_percent(self, obj):
-        if obj.sms_total_recipients == 0:
-            return 0
-        return int((obj.sms_sent_count + obj.sms_failed_count) / obj.sms_total_recipients * 100)
-
-    def get_overall_progress_percent(self, obj):
-        return obj.get_overall_progress()
-
-    def get_progress_percent(self, obj):
-        """Legacy field - returns email progress for backward compatibility."""
-        return self.get_email_progress_percent(obj)
-
 
 class MessageJobCreateSerializer(serializers.Serializer):
     """Serializer for creating a new message job."""
@@ -93,7 +77,8 @@ class MessageJobCreateSerializer(serializers.Serializer):
     )
 
     def validate(self, data):
-        channels = data.get('channels', [])
+        # Drop repeated channels, keeping the order they were given in
+        channels = data['channels'] = list(dict.fromkeys(data.get('channels', [])))
 
         # Require at least one channel
         if not channels:
@@ -113,11 +98,12 @@ class MessageJobCreateSerializer(serializers.Serializer):
 class MessageJobListSerializer(serializers.ModelSerializer):
     """Lightweight serializer for listing jobs (no recipients)."""
     sender_email = serializers.EmailField(source='sender.email', read_only=True)
-    email_progress_percent = serializers.SerializerMethodField()
-    sms_progress_percent = serializers.SerializerMethodField()
-    overall_progress_percent = serializers.SerializerMethodField()
+    # Progress is annotated onto the queryset by the view
+    email_progress_percent = serializers.IntegerField(read_only=True)
+    sms_progress_percent = serializers.IntegerField(read_only=True)
+    overall_progress_percent = serializers.IntegerField(read_only=True)
     # Legacy field
-    progress_percent = serializers.SerializerMethodField()
+    progress_percent = serializers.IntegerField(read_only=True)
 
     class Meta:
         model = MessageJob
@@ -135,23 +121,6 @@ class MessageJobListSerializer(serializers.ModelSerializer):
             'overall_progress_percent', 'progress_percent'
         ]
 
-    def get_email_progress_percent(self, obj):
-        if obj.email_total_recipients == 0:
-            return 0
-        return int((obj.email_sent_count + obj.email_failed_count) / obj.email_total_recipients * 100)
-
-    def get_sms_progress_percent(self, obj):
-        if obj.sms_total_recipients == 0:
-            return 0
-        return int((obj.sms_sent_count + obj.sms_failed_count) / obj.sms_total_recipients * 100)
-
-    def get_overall_progress_percent(self, obj):
-        return obj.get_overall_progress()
-
-    def get_progress_percent(self, obj):
-        """Legacy field - returns email progress for backward compatibility."""
-        return self.get_email_progress_percent(obj)
-
 
 # Backward compatibility aliases
 EmailJobSerializer = MessageJobSerializer
@@ -11,6 +11,7 @@ Example:
 
 import importlib
 import logging
+from functools import lru_cache
 
 from django.conf import settings
 
@@ -95,7 +96,7 @@ Message ({len(message)} chars):
 {'='*60}
 """
         print(output)
-        logger.info(f"[Console SMS] To: {to}, Length: {len(message)} chars")
+        logger.info("[Console SMS] To: %s, Length: %s chars", to, len(message))
         return {
             'status': 'sent',
             'provider': 'console',
@@ -126,6 +127,23 @@ class MNotifyBackend(BaseSMSBackend):
                 "Set MNOTIFY_API_KEY and MNOTIFY_SENDER_ID."
             )
 
+        self._session = None
+
+    @property
+    def session(self):
+        """HTTP session reused across calls so they share one pooled TLS connection."""
+        if self._session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+
+            # Only connection failures are retried: those requests never reached
+            # MNotify, so resending them can't deliver an SMS twice
+            retry = Retry(total=2, connect=2, read=0, status=0, backoff_factor=0.5)
+            self._session = requests.Session()
+            self._session.mount('https://', HTTPAdapter(max_retries=retry))
+        return self._session
+
     def send(self, to: str, message: str, **kwargs) -> dict:
         """Send SMS via MNotify API."""
         import requests
@@ -142,7 +160,7 @@ class MNotifyBackend(BaseSMSBackend):
                 'schedule_date': '',
             }
 
-            response = requests.post(
+            response = self.session.post(
                 self.API_URL,
                 json=payload,
                 params={'key': self.api_key},
@@ -159,7 +177,7 @@ class MNotifyBackend(BaseSMSBackend):
                     f"(code: {result.get('code')})"
                 )
 
-            logger.info(f"[MNotify] SMS sent to {to}: {result}")
+            logger.info("[MNotify] SMS sent to %s: %s", to, result)
 
             return {
                 'status': 'sent',
@@ -169,7 +187,7 @@ class MNotifyBackend(BaseSMSBackend):
             }
 
         except requests.RequestException as e:
-            logger.error(f"[MNotify] Failed to send SMS to {to}: {e}")
+            logger.error("[MNotify] Failed to send SMS to %s: %s", to, e)
             if not self.fail_silently:
                 raise SMSError(f"Failed to send SMS: {e}") from e
             return {
@@ -203,7 +221,7 @@ class MNotifyBackend(BaseSMSBackend):
                 'schedule_date': '',
             }
 
-            response = requests.post(
+            response = self.session.post(
                 self.API_URL,
                 json=payload,
                 params={'key': self.api_key},
@@ -221,7 +239,8 @@ class MNotifyBackend(BaseSMSBackend):
                 )
 
             logger.info(
-                f"[MNotify] Bulk SMS sent to {len(recipients)} recipients: {result}"
+                "[MNotify] Bulk SMS sent to %s recipients: %s",
+                len(recipients), result,
             )
 
             return [
@@ -236,8 +255,8 @@ class MNotifyBackend(BaseSMSBackend):
 
         except requests.RequestException as e:
             logger.error(
-                f"[MNotify] Failed to send bulk SMS to "
-                f"{len(recipients)} recipients: {e}"
+                "[MNotify] Failed to send bulk SMS to %s recipients: %s",
+                len(recipients), e,
             )
             if not self.fail_silently:
                 raise SMSError(f"Failed to send bulk SMS: {e}") from e
@@ -271,20 +290,25 @@ def get_sms_backend(fail_silently=False) -> BaseSMSBackend:
         'apps.messaging.sms_backends.ConsoleSMSBackend'
     )
 
+    return _load_backend_class(backend_path)(fail_silently=fail_silently)
+
+
+@lru_cache(maxsize=8)
+def _load_backend_class(backend_path):
+    """Resolve a backend dotted path to its class (cached per path)."""
     try:
         # Split the path into module and class name
         module_path, class_name = backend_path.rsplit('.', 1)
         module = importlib.import_module(module_path)
         backend_class = getattr(module, class_name)
-
-        if not issubclass(backend_class, BaseSMSBackend):
-            raise SMSError(f"{backend_path} is not a valid SMS backend")
-
-        return backend_class(fail_silently=fail_silently)
-
     except (ImportError, AttributeError, ValueError) as e:
         raise SMSError(f"Could not load SMS backend '{backend_path}': {e}") from e
 
+    if not isinstance(backend_class, type) or not issubclass(backend_class, BaseSMSBackend):
+        raise SMSError(f"{backend_path} is not a valid SMS backend")
+
+    return backend_class
+
 
 def send_sms(to: str, message: str, fail_silently=False, **kwargs) -> dict:
     """
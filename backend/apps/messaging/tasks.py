@@ -1,21 +1,75 @@
+import copy
 import logging
+import smtplib
 import threading
-import time
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, wait
+from datetime import timedelta
+from itertools import count
 
 from django.conf import settings
-from django.core.mail import send_mail
+from django.core.mail import EmailMessage
 from django.db import close_old_connections, models, transaction
 from django.utils import timezone
 
+from .delivery import SMTPConnectionPool, TokenBucket
 from .models import Channel, EmailRecipient, MessageJob, SMSRecipient
-from .sms_backends import get_sms_backend, SMSError
+from .sms_backends import get_sms_backend
 
 logger = logging.getLogger(__name__)
 
 # Batch processing defaults
 DEFAULT_BATCH_SIZE = 50
 DEFAULT_BATCH_DELAY = 1.0  # seconds
+DEFAULT_MESSAGING_WORKERS = 2  # jobs processed concurrently per process
+DEFAULT_EMAIL_CONCURRENCY = 4  # parallel SMTP sessions per job; keep under the provider's cap
+
+# Abort a job's email run when a batch this large fails at more than this
+# ratio; it usually means bad credentials or a provider block, not bad addresses
+ABORT_MIN_BATCH_SIZE = 30
+ABORT_FAILURE_RATIO = 0.33
+
+# Recipients still marked sending after this long were claimed by a run that
+# died before writing its results (batches take seconds, not minutes)
+STALE_SENDING_TIMEOUT = timedelta(minutes=10)
+
+
+class BatchFailureRateExceeded(Exception):
+    """Raised when too many sends in a batch fail for the job to continue."""
+    pass
+
+
+def _rate_limiter(rate_setting, batch_size, batch_delay):
+    """
+    Build the send throttle for a channel, or None when unthrottled.
+    Without an explicit rate, keep the average rate the batch settings used
+    to enforce, minus the idle gaps.
+    """
+    rate = getattr(settings, rate_setting, None)
+    if not rate and batch_delay > 0:
+        rate = batch_size / batch_delay
+    return TokenBucket(rate, capacity=batch_size) if rate else None
+
+
+def _claim(model, ids):
+    """
+    Mark the given recipients as sending in one UPDATE.
+    sent_at holds the claim time until the outcome overwrites it, so claims
+    abandoned by a run that died can be found later.
+    """
+    model.objects.filter(id__in=ids).update(status=model.Status.SENDING, sent_at=timezone.now())
+
+
+def _primary_or_first(residence, related_name):
+    """
+    Pick the primary row of a residence contact relation, else the first one.
+    Uses the prefetched rows when the caller loaded them; otherwise runs one
+    ordered query instead of fetching every row.
+    """
+    manager = getattr(residence, related_name)
+    if related_name in getattr(residence, '_prefetched_objects_cache', {}):
+        return min(manager.all(), key=lambda row: (not row.is_primary, row.pk), default=None)
+    return manager.order_by('-is_primary', 'pk').first()
 
 
 def get_recipient_email(residence):
@@ -23,12 +77,8 @@ def get_recipient_email(residence):
     Get the best email address for a residence.
     Priority: primary email > first available email.
     """
-    emails = residence.email_addresses.all()
-    primary = emails.filter(is_primary=True).first()
-    if primary:
-        return primary.email
-    first = emails.first()
-    return first.email if first else None
+    email = _primary_or_first(residence, 'email_addresses')
+    return email.email if email else None
 
 
 def get_recipient_phone(residence):
@@ -36,12 +86,8 @@ def get_recipient_phone(residence):
     Get the best phone number for a residence.
     Priority: primary phone > first available phone.
     """
-    phones = residence.phone_numbers.all()
-    primary = phones.filter(is_primary=True).first()
-    if primary:
-        return primary.number
-    first = phones.first()
-    return first.number if first else None
+    phone = _primary_or_first(residence, 'phone_numbers')
+    return phone.number if phone else None
 
 
 def process_email_recipients(job_id):
@@ -55,57 +101,122 @@ def process_email_recipients(job_id):
 
         batch_size = getattr(settings, 'EMAIL_BATCH_SIZE', DEFAULT_BATCH_SIZE)
         batch_delay = getattr(settings, 'EMAIL_BATCH_DELAY', DEFAULT_BATCH_DELAY)
+        bucket = _rate_limiter('EMAIL_RPS', batch_size, batch_delay)
 
         display_name = getattr(settings, 'DEFAULT_FROM_EMAIL_DISPLAY_NAME', 'Residency Administrator')
         email_address = settings.DEFAULT_FROM_EMAIL
         from_email = f'{display_name} <{email_address}>'
 
-        pending_recipients = list(job.email_recipients.filter(status=EmailRecipient.Status.PENDING))
-        total_recipients = len(pending_recipients)
+        pending = job.email_recipients.filter(status=EmailRecipient.Status.PENDING)
+        total_recipients = pending.count()
 
-        logger.info(f"Processing email recipients for job {job_id}: {total_recipients} recipients")
+        logger.info("Processing email recipients for job %s: %s recipients", job_id, total_recipients)
 
-        for batch_num, i in enumerate(range(0, total_recipients, batch_size)):
-            batch = pending_recipients[i:i + batch_size]
-
-            if batch_num > 0 and batch_delay > 0:
-                time.sleep(batch_delay)
-
-            for recipient in batch:
-                try:
-                    send_mail(
-                        subject=job.subject,
-                        message=job.body,
-                        from_email=from_email,
-                        recipient_list=[recipient.email_address],
-                        fail_silently=False,
-                    )
-                    recipient.status = EmailRecipient.Status.SENT
-                    recipient.sent_at = timezone.now()
-                    recipient.save(update_fields=['status', 'sent_at'])
+        # Build the message once per job; each send only swaps the recipient
+        message_template = EmailMessage(
+            subject=job.subject,
+            body=job.body,
+            from_email=from_email,
+        )
 
-                    MessageJob.objects.filter(id=job_id).update(
-                        email_sent_count=models.F('email_sent_count') + 1,
-                        sent_count=models.F('sent_count') + 1,
-                    )
+        attempted = 0
 
-                except Exception as e:
-                    logger.error(f"Failed to send email to {recipient.email_address}: {e}")
-                    recipient.status = EmailRecipient.Status.FAILED
-                    recipient.error_message = str(e)
-                    recipient.save(update_fields=['status', 'error_message'])
+        concurrency = getattr(settings, 'EMAIL_CONCURRENCY', DEFAULT_EMAIL_CONCURRENCY)
 
-                    MessageJob.objects.filter(id=job_id).update(
-                        email_failed_count=models.F('email_failed_count') + 1,
-                        failed_count=models.F('failed_count') + 1,
-                    )
+        # Each send worker keeps its own SMTP connection for the whole job
+        pool = SMTPConnectionPool()
 
-            logger.info(f"Job {job_id}: Completed email batch {batch_num + 1}")
+        def send_one(recipient):
+            connection = pool.get()
+            message = copy.copy(message_template)
+            message.to = [recipient.email_address]
+            try:
+                try:
+                    sent = connection.send_messages([message])
+                except smtplib.SMTPServerDisconnected:
+                    # Idle session dropped by the server; reconnect and retry once
+                    connection.close()
+                    connection.open()
+                    sent = connection.send_messages([message])
+            except Exception as e:
+                return recipient, e
+            if not sent:
+                return recipient, 'Message was not accepted for delivery'
+            return recipient, None
 
-        logger.info(f"Email processing completed for job {job_id}")
+        try:
+            # Sends within a batch run in parallel; DB writes stay on this thread
+            with ThreadPoolExecutor(
+                max_workers=concurrency, thread_name_prefix=f'message-email-{job_id}'
+            ) as executor:
+                for batch_num in count():
+                    # Claim the next batch in a short transaction. Rows another
+                    # processor of this job has locked are skipped, and the rows
+                    # locked here are marked sending by id so no one picks them
+                    # up once the lock is released.
+                    with transaction.atomic():
+                        batch = list(pending.select_for_update(skip_locked=True)[:batch_size])
+                        _claim(EmailRecipient, [recipient.id for recipient in batch])
+                    if not batch:
+                        break
+
+                    # Send with no transaction open; rate limiting may sleep
+                    if bucket:
+                        bucket.acquire(len(batch))
+
+                    batch_sent = 0
+                    batch_failed = 0
+                    results = list(executor.map(send_one, batch))
+                    now = timezone.now()
 
+                    for recipient, error in results:
+                        if error is None:
+                            recipient.status = EmailRecipient.Status.SENT
+                            recipient.sent_at = now
+                            batch_sent += 1
+                        else:
+                            logger.error("Failed to send email to %s: %s", recipient.email_address, error)
+                            recipient.status = EmailRecipient.Status.FAILED
+                            recipient.sent_at = None
+                            recipient.error_message = str(error)
+                            batch_failed += 1
+
+                    # Write the outcomes and job counters together in a second short transaction
+                    with transaction.atomic():
+                        EmailRecipient.objects.bulk_update(
+                            batch, ['status', 'sent_at', 'error_message'], batch_size=batch_size
+                        )
+                        MessageJob.objects.filter(id=job_id).update(
+                            email_sent_count=models.F('email_sent_count') + batch_sent,
+                            email_failed_count=models.F('email_failed_count') + batch_failed,
+                            sent_count=models.F('sent_count') + batch_sent,
+                            failed_count=models.F('failed_count') + batch_failed,
+                        )
+
+                    attempted += len(batch)
+                    if len(batch) >= ABORT_MIN_BATCH_SIZE and batch_failed / len(batch) > ABORT_FAILURE_RATIO:
+                        raise BatchFailureRateExceeded(
+                            f"Email sending aborted after {attempted} attempts; "
+                            f"batch failure rate {batch_failed / len(batch):.0%}"
+                        )
+
+                    logger.info("Job %s: Completed email batch %s", job_id, batch_num + 1)
+        finally:
+            pool.close_all()
+
+        logger.info("Email processing completed for job %s", job_id)
+
+    except BatchFailureRateExceeded as e:
+        # Stop sending and fail the job; its unsent recipients stay pending
+        # and go out with the failed ones on retry
+        logger.error("Email processing for job %s aborted: %s", job_id, e)
+        MessageJob.objects.filter(id=job_id).update(
+            status=MessageJob.Status.FAILED,
+            error_message=str(e),
+            completed_at=timezone.now(),
+        )
     except Exception as e:
-        logger.error(f"Email processing failed for job {job_id}: {e}")
+        logger.error("Email processing failed for job %s: %s", job_id, e)
     finally:
         close_old_connections()
 
@@ -121,77 +232,114 @@ def process_sms_recipients(job_id):
 
         batch_size = getattr(settings, 'SMS_BATCH_SIZE', DEFAULT_BATCH_SIZE)
         batch_delay = getattr(settings, 'SMS_BATCH_DELAY', DEFAULT_BATCH_DELAY)
+        bucket = _rate_limiter('SMS_RPS', batch_size, batch_delay)
 
         # Use sms_body if provided, otherwise fall back to main body
         message = job.sms_body if job.sms_body else job.body
 
-        sms_backend = get_sms_backend()
-
-        pending_recipients = list(job.sms_recipients.filter(status=SMSRecipient.Status.PENDING))
-        total_recipients = len(pending_recipients)
+        # fail_silently so send_bulk reports per-number failures instead of raising on the first
+        sms_backend = get_sms_backend(fail_silently=True)
 
-        # Group recipients by phone number so we only send once per unique number.
-        # Multiple residences may share the same phone number.
-        phone_to_recipients = defaultdict(list)
-        for recipient in pending_recipients:
-            phone_to_recipients[recipient.phone_number].append(recipient)
-
-        unique_numbers = list(phone_to_recipients.keys())
+        # Ordered by number so recipients sharing a number (multiple residences
+        # may) are claimed together and each number is sent only once
+        pending = job.sms_recipients.filter(status=SMSRecipient.Status.PENDING).order_by('phone_number', 'id')
+        totals = pending.aggregate(
+            recipients=models.Count('id'),
+            numbers=models.Count('phone_number', distinct=True),
+        )
 
         logger.info(
-            f"Processing SMS recipients for job {job_id}: "
-            f"{total_recipients} recipients, {len(unique_numbers)} unique numbers"
+            "Processing SMS recipients for job %s: "
+            "%s recipients, %s unique numbers",
+            job_id, totals['recipients'], totals['numbers'],
         )
 
-        for batch_num, i in enumerate(range(0, len(unique_numbers), batch_size)):
-            batch_numbers = unique_numbers[i:i + batch_size]
-
-            if batch_num > 0 and batch_delay > 0:
-                time.sleep(batch_delay)
-
-            for phone_number in batch_numbers:
-                recipients_for_number = phone_to_recipients[phone_number]
-                try:
-                    sms_backend.send(phone_number, message)
-
-                    now = timezone.now()
-                    for recipient in recipients_for_number:
-                        recipient.status = SMSRecipient.Status.SENT
-                        recipient.sent_at = now
-                        recipient.save(update_fields=['status', 'sent_at'])
-
-                    MessageJob.objects.filter(id=job_id).update(
-                        sms_sent_count=models.F('sms_sent_count') + len(recipients_for_number),
-                    )
-
-                except SMSError as e:
-                    logger.error(f"Failed to send SMS to {phone_number}: {e}")
-                    for recipient in recipients_for_number:
-                        recipient.status = SMSRecipient.Status.FAILED
-                        recipient.error_message = str(e)
-                        recipient.save(update_fields=['status', 'error_message'])
-
-                    MessageJob.objects.filter(id=job_id).update(
-                        sms_failed_count=models.F('sms_failed_count') + len(recipients_for_number),
+        for batch_num in count():
+            # Claim the next batch in a short transaction: the numbers of up to
+            # batch_size pending rows that no other processor of this job has
+            # locked, then every pending recipient of those numbers, marked
+            # sending by id so no one picks them up once the lock is released.
+            # Both selects skip rows locked elsewhere, so two processors never
+            # wait on each other's locks.
+            with transaction.atomic():
+                numbers = pending.select_for_update(skip_locked=True).values('phone_number')[:batch_size]
+                locked = list(pending.filter(
+                    phone_number__in=numbers,
+                ).select_for_update(skip_locked=True).values_list('phone_number', 'id'))
+
+                # Each number is still sent only once: a number with pending rows
+                # locked by another processor is left alone, and goes out on a
+                # later batch of whichever processor then locks all of its rows
+                contended = set(pending.filter(
+                    phone_number__in={phone_number for phone_number, _ in locked},
+                ).exclude(
+                    id__in=[recipient_id for _, recipient_id in locked],
+                ).values_list('phone_number', flat=True))
+
+                # Plain (phone_number, id) rows for the claimed recipients; only
+                # the ids are needed to write outcomes
+                phone_to_ids = defaultdict(list)
+                for phone_number, recipient_id in locked:
+                    if phone_number not in contended:
+                        phone_to_ids[phone_number].append(recipient_id)
+                _claim(SMSRecipient, [recipient_id for ids in phone_to_ids.values() for recipient_id in ids])
+            if not locked:
+                break
+            if not phone_to_ids:
+                continue
+            batch_numbers = list(phone_to_ids)
+
+            # Send with no transaction open; rate limiting may sleep
+            if bucket:
+                bucket.acquire(len(batch_numbers))
+
+            # One provider call per batch; a failure of the call itself fails every number in it
+            try:
+                results = sms_backend.send_bulk(batch_numbers, message)
+            except Exception as e:
+                logger.error("Failed to send SMS batch %s for job %s: %s", batch_num + 1, job_id, e)
+                results = [{'status': 'failed', 'error': str(e), 'to': n} for n in batch_numbers]
+
+            # Collect ids per outcome so the batch is written with one UPDATE each
+            sent_ids = []
+            failed_ids = defaultdict(list)  # error message -> recipient ids
+
+            for phone_number, result in zip(batch_numbers, results):
+                ids = phone_to_ids[phone_number]
+                if result.get('status') == 'sent':
+                    sent_ids.extend(ids)
+                else:
+                    error = result.get('error', 'SMS was not sent')
+                    logger.error("Failed to send SMS to %s: %s", phone_number, error)
+                    failed_ids[error].extend(ids)
+
+            batch_sent = len(sent_ids)
+            batch_failed = sum(len(ids) for ids in failed_ids.values())
+
+            # Write the outcomes and job counters together in a second short transaction
+            with transaction.atomic():
+                if sent_ids:
+                    SMSRecipient.objects.filter(id__in=sent_ids).update(
+                        status=SMSRecipient.Status.SENT,
+                        sent_at=timezone.now(),
                     )
-
-                except Exception as e:
-                    logger.error(f"Unexpected error sending SMS to {phone_number}: {e}")
-                    for recipient in recipients_for_number:
-                        recipient.status = SMSRecipient.Status.FAILED
-                        recipient.error_message = str(e)
-                        recipient.save(update_fields=['status', 'error_message'])
-
-                    MessageJob.objects.filter(id=job_id).update(
-                        sms_failed_count=models.F('sms_failed_count') + len(recipients_for_number),
+                for error, ids in failed_ids.items():
+                    SMSRecipient.objects.filter(id__in=ids).update(
+                        status=SMSRecipient.Status.FAILED,
+                        error_message=error,
+                        sent_at=None,
                     )
+                MessageJob.objects.filter(id=job_id).update(
+                    sms_sent_count=models.F('sms_sent_count') + batch_sent,
+                    sms_failed_count=models.F('sms_failed_count') + batch_failed,
+                )
 
-            logger.info(f"Job {job_id}: Completed SMS batch {batch_num + 1}")
+            logger.info("Job %s: Completed SMS batch %s", job_id, batch_num + 1)
 
-        logger.info(f"SMS processing completed for job {job_id}")
+        logger.info("SMS processing completed for job %s", job_id)
 
     except Exception as e:
-        logger.error(f"SMS processing failed for job {job_id}: {e}")
+        logger.error("SMS processing failed for job %s: %s", job_id, e)
     finally:
         close_old_connections()
 
@@ -199,46 +347,51 @@ def process_sms_recipients(job_id):
 def finalize_job(job_id):
     """
     Finalize a job after all channel processing is complete.
+    Runs inline on the job's thread, which manages its DB connection.
     """
-    close_old_connections()
-
     try:
-        job = MessageJob.objects.get(id=job_id)
-        job.refresh_from_db()
-
-        # Check if all recipients have been processed
-        email_pending = job.email_recipients.filter(status=EmailRecipient.Status.PENDING).exists()
-        sms_pending = job.sms_recipients.filter(status=SMSRecipient.Status.PENDING).exists()
-
-        if not email_pending and not sms_pending:
+        # Load the job and check both channels for unfinished recipients in one
+        # query; rows another run is still sending count as unfinished
+        job = MessageJob.objects.annotate(
+            email_pending=models.Exists(EmailRecipient.objects.filter(
+                job=models.OuterRef('pk'),
+                status__in=[EmailRecipient.Status.PENDING, EmailRecipient.Status.SENDING],
+            )),
+            sms_pending=models.Exists(SMSRecipient.objects.filter(
+                job=models.OuterRef('pk'),
+                status__in=[SMSRecipient.Status.PENDING, SMSRecipient.Status.SENDING],
+            )),
+        ).get(id=job_id)
+
+        if not job.email_pending and not job.sms_pending:
             # All done - mark as completed
             job.status = MessageJob.Status.COMPLETED
             job.completed_at = timezone.now()
             job.save(update_fields=['status', 'completed_at'])
 
             logger.info(
-                f"Message job {job_id} completed: "
-                f"Email ({job.email_sent_count} sent, {job.email_failed_count} failed), "
-                f"SMS ({job.sms_sent_count} sent, {job.sms_failed_count} failed)"
+                "Message job %s completed: "
+                "Email (%s sent, %s failed), "
+                "SMS (%s sent, %s failed)",
+                job_id, job.email_sent_count, job.email_failed_count, job.sms_sent_count, job.sms_failed_count,
             )
 
     except Exception as e:
-        logger.error(f"Failed to finalize job {job_id}: {e}")
+        logger.error("Failed to finalize job %s: %s", job_id, e)
         try:
-            job = MessageJob.objects.get(id=job_id)
-            job.status = MessageJob.Status.FAILED
-            job.error_message = str(e)
-            job.completed_at = timezone.now()
-            job.save(update_fields=['status', 'error_message', 'completed_at'])
+            # One UPDATE by pk; no need to reload the job just to flag it failed
+            MessageJob.objects.filter(id=job_id).update(
+                status=MessageJob.Status.FAILED,
+                error_message=str(e),
+                completed_at=timezone.now(),
+            )
         except Exception:
             pass
-    finally:
-        close_old_connections()
 
 
 def process_message_job(job_id):
     """
-    Process a message job, spawning threads for each enabled channel.
+    Process a message job, running each enabled channel on the channel pool.
     Waits for all channels to complete before finalizing.
     """
     close_old_connections()
@@ -248,70 +401,87 @@ def process_message_job(job_id):
             job = MessageJob.objects.select_for_update().get(id=job_id)
 
             if job.status == MessageJob.Status.COMPLETED:
-                logger.info(f"Message job {job_id} already completed, skipping")
+                logger.info("Message job %s already completed, skipping", job_id)
                 return
 
             if job.status not in [MessageJob.Status.PENDING, MessageJob.Status.PROCESSING, MessageJob.Status.FAILED]:
-                logger.warning(f"Message job {job_id} has unexpected status {job.status}, skipping")
+                logger.warning("Message job %s has unexpected status %s, skipping", job_id, job.status)
                 return
 
             job.status = MessageJob.Status.PROCESSING
             job.started_at = job.started_at or timezone.now()
             job.save(update_fields=['status', 'started_at'])
 
-        threads = []
+        _, channel_executor = _get_executors()
+        futures = []
 
-        # Start email processing thread
+        # Process each enabled channel in parallel
         if job.has_channel(Channel.EMAIL):
-            email_thread = threading.Thread(
-                target=process_email_recipients,
-                args=(job_id,),
-                daemon=True
-            )
-            threads.append(email_thread)
-            email_thread.start()
-            logger.info(f"Started email processing thread for job {job_id}")
+            futures.append(channel_executor.submit(process_email_recipients, job_id))
+            logger.info("Queued email processing for job %s", job_id)
 
-        # Start SMS processing thread
         if job.has_channel(Channel.SMS):
-            sms_thread = threading.Thread(
-                target=process_sms_recipients,
-                args=(job_id,),
-                daemon=True
-            )
-            threads.append(sms_thread)
-            sms_thread.start()
-            logger.info(f"Started SMS processing thread for job {job_id}")
+            futures.append(channel_executor.submit(process_sms_recipients, job_id))
+            logger.info("Queued SMS processing for job %s", job_id)
 
-        # Wait for all threads to complete
-        for thread in threads:
-            thread.join()
+        # Wait for all channels to complete
+        wait(futures)
 
         # Finalize the job
         finalize_job(job_id)
 
     except Exception as e:
-        logger.error(f"Message job {job_id} failed: {e}")
+        logger.error("Message job %s failed: %s", job_id, e)
         try:
-            job = MessageJob.objects.get(id=job_id)
-            job.status = MessageJob.Status.FAILED
-            job.error_message = str(e)
-            job.completed_at = timezone.now()
-            job.save(update_fields=['status', 'error_message', 'completed_at'])
+            # One UPDATE by pk; no need to reload the job just to flag it failed
+            MessageJob.objects.filter(id=job_id).update(
+                status=MessageJob.Status.FAILED,
+                error_message=str(e),
+                completed_at=timezone.now(),
+            )
         except Exception:
             pass
     finally:
         close_old_connections()
 
 
+# Bounded pools instead of a raw thread per job and per channel; jobs beyond
+# the worker count wait their turn. Channels get their own pool so a job
+# waiting on its channels never holds the threads they need. Both are created
+# on first use, so processes that never send a message don't start them.
+_executor_lock = threading.Lock()
+_job_executor = None
+_channel_executor = None
+
+
+def _get_executors():
+    """
+    Return the job and channel pools, creating them on first use.
+    """
+    global _job_executor, _channel_executor
+    with _executor_lock:
+        workers = getattr(settings, 'MESSAGING_WORKERS', DEFAULT_MESSAGING_WORKERS)
+        if _job_executor is None:
+            _job_executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='message-job')
+        if _channel_executor is None:
+            _channel_executor = ThreadPoolExecutor(
+                max_workers=workers * len(Channel),
+                thread_name_prefix='message-channel',
+            )
+        return _job_executor, _channel_executor
+
+
 def start_message_job(job_id):
     """
-    Start processing a message job in a background thread.
+    Queue a message job for background processing.
     Returns immediately, allowing the API to respond.
+
+    The queue lives in this process: jobs still queued or running when the
+    worker is recycled are lost and stay pending/processing until retry()
+    re-queues them.
     """
-    thread = threading.Thread(target=process_message_job, args=(job_id,), daemon=True)
-    thread.start()
-    return thread
+    job_executor, _ = _get_executors()
+    return job_executor.submit(process_message_job, job_id)
 
 
 # Backward compatibility aliases
@@ -1,3 +1,337 @@
-from django.test import TestCase
+from concurrent.futures import Future
+from datetime import timedelta
+from unittest import mock
 
-# Create your tests here.
+from django.core import mail
+from django.core.cache import cache
+from django.core.mail.backends.locmem import EmailBackend
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.residences.models import EmailAddress, PhoneNumber, Residence
+from apps.users.models import User
+
+from . import tasks
+from .models import EmailRecipient, MessageJob, SMSRecipient
+from .sms_backends import BaseSMSBackend
+
+
+class FlakyEmailBackend(EmailBackend):
+    """Locmem backend that rejects any address containing 'bad'."""
+
+    def send_messages(self, messages):
+        if any('bad' in address for message in messages for address in message.to):
+            raise ValueError('rejected')
+        return super().send_messages(messages)
+
+
+class RecordingSMSBackend(BaseSMSBackend):
+    """Records bulk calls; numbers ending in 0 fail."""
+
+    calls = []
+
+    def send(self, to, message, **kwargs):
+        raise NotImplementedError
+
+    def send_bulk(self, recipients, message, **kwargs):
+        self.calls.append(list(recipients))
+        return [
+            {'status': 'failed', 'error': 'unreachable', 'to': to} if to.endswith('0')
+            else {'status': 'sent', 'to': to}
+            for to in recipients
+        ]
+
+
+class InlineExecutor:
+    """Runs submitted work on the calling thread, inside the test transaction."""
+
+    def submit(self, fn, *args):
+        future = Future()
+        future.set_result(fn(*args))
+        return future
+
+
+def _job(**kwargs):
+    return MessageJob.objects.create(subject='Notice', body='Water is off today', **kwargs)
+
+
+class MessageJobCreateTests(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_superuser(email='admin@example.com', username='admin', password='x')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_recipients_use_primary_contact_or_first(self):
+        with_primary = Residence.objects.create(house_number='A1', name='Mensah')
+        EmailAddress.objects.create(residence=with_primary, email='other@example.com')
+        EmailAddress.objects.create(residence=with_primary, email='primary@example.com', is_primary=True)
+        PhoneNumber.objects.create(residence=with_primary, number='0241111111')
+        without_primary = Residence.objects.create(house_number='A2', name='Owusu')
+        EmailAddress.objects.create(residence=without_primary, email='first@example.com')
+        EmailAddress.objects.create(residence=without_primary, email='second@example.com')
+        Residence.objects.create(house_number='A3', name='No contacts')
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            response = self.client.post('/api/v1/messaging/', {
+                'subject': 'Notice', 'body': 'Hello', 'channels': ['email', 'sms'],
+            }, format='json')
+
+        self.assertEqual(response.status_code, 201)
+        job = MessageJob.objects.get()
+        self.assertEqual(
+            dict(job.email_recipients.values_list('residence__house_number', 'email_address')),
+            {'A1': 'primary@example.com', 'A2': 'first@example.com'},
+        )
+        self.assertEqual(list(job.sms_recipients.values_list('phone_number', flat=True)), ['0241111111'])
+        self.assertEqual(
+            set(job.email_recipients.values_list('status', flat=True)), {EmailRecipient.Status.PENDING},
+        )
+        self.assertEqual((job.email_total_recipients, job.sms_total_recipients), (2, 1))
+        self.assertEqual(response.data['email_total_recipients'], 2)
+        # Processing starts only once the job is committed
+        self.assertEqual(len(callbacks), 1)
+
+    def test_no_recipients_rolls_back(self):
+        Residence.objects.create(house_number='B1', name='No contacts')
+
+        response = self.client.post('/api/v1/messaging/', {
+            'subject': 'Notice', 'body': 'Hello', 'channels': ['email'],
+        }, format='json')
+
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(MessageJob.objects.exists())
+
+
+@override_settings(
+    EMAIL_BACKEND='apps.messaging.tests.FlakyEmailBackend',
+    SMS_BACKEND='apps.messaging.tests.RecordingSMSBackend',
+    EMAIL_BATCH_SIZE=2, SMS_BATCH_SIZE=2,
+    EMAIL_BATCH_DELAY=0, SMS_BATCH_DELAY=0,
+    EMAIL_RPS=0, SMS_RPS=0,
+)
+class MessageProcessingTests(TestCase):
+
+    def setUp(self):
+        RecordingSMSBackend.calls = []
+        # The workers manage their own connections; in a test they share the
+        # test transaction instead
+        patcher = mock.patch.object(tasks, 'close_old_connections')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.residence = Residence.objects.create(house_number='C1', name='Asante')
+
+    def _email(self, job, address, **kwargs):
+        return EmailRecipient.objects.create(job=job, residence=self.residence, email_address=address, **kwargs)
+
+    def _sms(self, job, number, **kwargs):
+        return SMSRecipient.objects.create(job=job, residence=self.residence, phone_number=number, **kwargs)
+
+    def test_two_channel_job_completes(self):
+        job = _job(channels=['email', 'sms'], email_total_recipients=5, sms_total_recipients=4)
+        for address in ['a@example.com', 'bad@example.com', 'c@example.com', 'd@example.com', 'e@example.com']:
+            self._email(job, address)
+        # Two residences share a number; it should be texted once
+        for number in ['0241', '0241', '0242', '0250']:
+            self._sms(job, number)
+
+        with mock.patch.object(tasks, '_channel_executor', InlineExecutor()), \
+                self.assertLogs('apps.messaging.tasks', 'ERROR'):
+            tasks.process_message_job(job.id)
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, MessageJob.Status.COMPLETED)
+        self.assertIsNotNone(job.completed_at)
+        self.assertEqual((job.email_sent_count, job.email_failed_count), (4, 1))
+        self.assertEqual((job.sent_count, job.failed_count), (4, 1))
+        self.assertEqual((job.sms_sent_count, job.sms_failed_count), (3, 1))
+
+        self.assertEqual(sorted(m.to[0] for m in mail.outbox), [
+            'a@example.com', 'c@example.com', 'd@example.com', 'e@example.com',
+        ])
+        failed = job.email_recipients.get(status=EmailRecipient.Status.FAILED)
+        self.assertEqual((failed.email_address, failed.error_message, failed.sent_at), ('bad@example.com', 'rejected', None))
+        self.assertFalse(job.email_recipients.filter(status=EmailRecipient.Status.SENT, sent_at__isnull=True).exists())
+
+        sent_numbers = [number for call in RecordingSMSBackend.calls for number in call]
+        self.assertEqual(sorted(sent_numbers), ['0241', '0242', '0250'])
+        self.assertEqual(
+            sorted(job.sms_recipients.values_list('phone_number', 'status')),
+            [('0241', 'sent'), ('0241', 'sent'), ('0242', 'sent'), ('0250', 'failed')],
+        )
+        self.assertFalse(job.email_recipients.filter(status=EmailRecipient.Status.SENDING).exists())
+        self.assertFalse(job.sms_recipients.filter(status=SMSRecipient.Status.SENDING).exists())
+
+    def test_rows_claimed_elsewhere_are_not_sent(self):
+        job = _job(channels=['email'], status=MessageJob.Status.PROCESSING, email_total_recipients=2)
+        self._email(job, 'a@example.com')
+        self._email(job, 'b@example.com', status=EmailRecipient.Status.SENDING, sent_at=timezone.now())
+
+        tasks.process_email_recipients(job.id)
+        tasks.finalize_job(job.id)
+
+        self.assertEqual([m.to[0] for m in mail.outbox], ['a@example.com'])
+        job.refresh_from_db()
+        # The other run still owns a row, so the job isn't finished
+        self.assertEqual(job.status, MessageJob.Status.PROCESSING)
+
+    def test_claims_are_tracked_by_id(self):
+        claimed_at = timezone.now()
+        job = _job(channels=['email', 'sms'], status=MessageJob.Status.PROCESSING)
+        self._email(job, 'a@example.com')
+        self._email(job, 'b@example.com', status=EmailRecipient.Status.SENDING, sent_at=claimed_at)
+        self._sms(job, '0241')
+        self._sms(job, '0242', status=SMSRecipient.Status.SENDING, sent_at=claimed_at)
+
+        # Another run's claim stamped with the same time is not picked up
+        with mock.patch.object(tasks.timezone, 'now', return_value=claimed_at):
+            tasks.process_email_recipients(job.id)
+            tasks.process_sms_recipients(job.id)
+
+        self.assertEqual([m.to[0] for m in mail.outbox], ['a@example.com'])
+        self.assertEqual(RecordingSMSBackend.calls, [['0241']])
+        self.assertEqual(job.email_recipients.get(email_address='b@example.com').status, EmailRecipient.Status.SENDING)
+        self.assertEqual(job.sms_recipients.get(phone_number='0242').status, SMSRecipient.Status.SENDING)
+
+    def test_failed_result_write_does_not_resend(self):
+        job = _job(channels=['email'], email_total_recipients=2)
+        self._email(job, 'a@example.com')
+        self._email(job, 'b@example.com')
+
+        with mock.patch.object(EmailRecipient.objects, 'bulk_update', side_effect=RuntimeError('write failed')), \
+                self.assertLogs('apps.messaging.tasks', 'ERROR'):
+            tasks.process_email_recipients(job.id)
+        tasks.process_email_recipients(job.id)
+
+        # The claimed batch stays claimed rather than going back to pending
+        self.assertEqual(len(mail.outbox), 2)
+        self.assertEqual(
+            set(job.email_recipients.values_list('status', flat=True)), {EmailRecipient.Status.SENDING},
+        )
+
+
+class MessageJobViewTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_superuser(email='admin@example.com', username='admin', password='x')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.residence = Residence.objects.create(house_number='D1', name='Boateng')
+
+    def _recipients(self, job, count, **kwargs):
+        EmailRecipient.objects.bulk_create([
+            EmailRecipient(job=job, residence=self.residence, email_address=f'r{i}@example.com', **kwargs)
+            for i in range(count)
+        ])
+
+    def _email(self, job, address, **kwargs):
+        return EmailRecipient.objects.create(job=job, residence=self.residence, email_address=address, **kwargs)
+
+    def test_list_query_count_does_not_grow_with_jobs(self):
+        _job(channels=['email'], sender=self.user)
+        with CaptureQueriesContext(connection) as one_job:
+            self.client.get('/api/v1/messaging/')
+        _job(channels=['email'], sender=self.user)
+        _job(channels=['email'], sender=self.user)
+
+        # Senders come joined to their jobs rather than one query each
+        with self.assertNumQueries(len(one_job)):
+            data = self.client.get('/api/v1/messaging/').data
+        self.assertEqual({row['sender_email'] for row in data['results']}, {'admin@example.com'})
+
+    def test_recipients_cursor_pagination(self):
+        job = _job(channels=['email'], email_total_recipients=25)
+        self._recipients(job, 25)
+        url = f'/api/v1/messaging/{job.pk}/email-recipients/'
+
+        seen = []
+        cursor = 0
+        for expected_size, expected_next in [(10, True), (10, True), (5, False)]:
+            data = self.client.get(url, {'cursor': cursor}).data
+            self.assertEqual(data['count'], 25)
+            self.assertEqual(len(data['results']), expected_size)
+            self.assertEqual(data['next'], expected_next)
+            seen += [row['id'] for row in data['results']]
+            cursor = data['next_cursor']
+        self.assertIsNone(cursor)
+        self.assertEqual(seen, sorted(job.email_recipients.values_list('id', flat=True)))
+
+        # Page numbers still work and line up with the cursor pages
+        page_two = self.client.get(url, {'page': 2}).data
+        self.assertEqual([row['id'] for row in page_two['results']], seen[10:20])
+
+    def test_recipients_rejects_bad_parameters(self):
+        job = _job(channels=['email'])
+        url = f'/api/v1/messaging/{job.pk}/email-recipients/'
+        for params in [{'cursor': 'abc'}, {'cursor': -1}, {'page': 0}, {'page': 'x'}]:
+            with self.subTest(params=params):
+                self.assertEqual(self.client.get(url, params).status_code, 400)
+
+    def test_status_etag_revalidates(self):
+        job = _job(channels=['email'], status=MessageJob.Status.PROCESSING, email_total_recipients=4)
+        url = f'/api/v1/messaging/{job.pk}/status/'
+
+        first = self.client.get(url)
+        self.assertEqual(first.status_code, 200)
+        unchanged = self.client.get(url, HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(unchanged.status_code, 304)
+        self.assertEqual(unchanged.content, b'')
+
+        MessageJob.objects.filter(pk=job.pk).update(email_sent_count=1)
+        cache.clear()
+        changed = self.client.get(url, HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(changed.status_code, 200)
+        self.assertNotEqual(changed['ETag'], first['ETag'])
+
+    def test_retry_without_failures(self):
+        job = _job(channels=['email'], status=MessageJob.Status.COMPLETED)
+        self._recipients(job, 2, status=EmailRecipient.Status.SENT)
+
+        response = self.client.post(f'/api/v1/messaging/{job.pk}/retry/')
+
+        self.assertEqual(response.status_code, 400)
+        job.refresh_from_db()
+        self.assertEqual(job.status, MessageJob.Status.COMPLETED)
+
+    def test_retry_requeues_failed_and_abandoned_recipients(self):
+        job = _job(
+            channels=['email'], status=MessageJob.Status.COMPLETED,
+            email_failed_count=1, failed_count=1,
+        )
+        failed = self._email(job, 'failed@example.com', status=EmailRecipient.Status.FAILED, error_message='boom')
+        abandoned = self._email(
+            job, 'abandoned@example.com', status=EmailRecipient.Status.SENDING,
+            sent_at=timezone.now() - tasks.STALE_SENDING_TIMEOUT - timedelta(minutes=1),
+        )
+        in_flight = self._email(job, 'inflight@example.com', status=EmailRecipient.Status.SENDING, sent_at=timezone.now())
+        sent = self._email(job, 'sent@example.com', status=EmailRecipient.Status.SENT, sent_at=timezone.now())
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            response = self.client.post(f'/api/v1/messaging/{job.pk}/retry/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(callbacks), 1)
+        job.refresh_from_db()
+        self.assertEqual(job.status, MessageJob.Status.PROCESSING)
+        self.assertEqual((job.email_failed_count, job.failed_count), (0, 0))
+        statuses = dict(job.email_recipients.values_list('pk', 'status'))
+        self.assertEqual(statuses, {
+            failed.pk: EmailRecipient.Status.PENDING,
+            abandoned.pk: EmailRecipient.Status.PENDING,
+            in_flight.pk: EmailRecipient.Status.SENDING,
+            sent.pk: EmailRecipient.Status.SENT,
+        })
+
+    def test_retry_requeues_stranded_job(self):
+        job = _job(channels=['email'], status=MessageJob.Status.PROCESSING)
+        self._email(job, 'queued@example.com')
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            response = self.client.post(f'/api/v1/messaging/{job.pk}/retry/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(callbacks), 1)
@@ -1,3 +1,12 @@
+from functools import partial
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models import ExpressionWrapper, F, IntegerField, Q, Value
+from django.db.models.functions import Greatest
+from django.utils import timezone
+from django.utils.http import parse_etags
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
@@ -14,7 +23,130 @@ from .serializers import (
     MessageJobSerializer,
     SMSRecipientSerializer,
 )
-from .tasks import get_recipient_email, get_recipient_phone, start_message_job
+from .tasks import STALE_SENDING_TIMEOUT, start_message_job
+
+
+def _percent(processed, total):
+    """Progress as a DB expression (integer division floors like int())."""
+    return ExpressionWrapper(
+        processed * 100 / Greatest(total, Value(1)),
+        output_field=IntegerField(),
+    )
+
+
+PROGRESS_ANNOTATIONS = {
+    'email_progress_percent': _percent(
+        F('email_sent_count') + F('email_failed_count'), F('email_total_recipients'),
+    ),
+    'sms_progress_percent': _percent(
+        F('sms_sent_count') + F('sms_failed_count'), F('sms_total_recipients'),
+    ),
+    'overall_progress_percent': _percent(
+        F('email_sent_count') + F('email_failed_count') + F('sms_sent_count') + F('sms_failed_count'),
+        F('email_total_recipients') + F('sms_total_recipients'),
+    ),
+    # Legacy field - mirrors email progress
+    'progress_percent': _percent(
+        F('email_sent_count') + F('email_failed_count'), F('email_total_recipients'),
+    ),
+}
+
+RECIPIENTS_PAGE_SIZE = 10
+
+# Columns the recipient serializers read (job is set from the related
+# manager); everything else stays in the database
+EMAIL_RECIPIENT_LIST_FIELDS = (
+    'id', 'job', 'residence', 'residence__name', 'residence__house_number',
+    'email_address', 'status', 'error_message', 'sent_at',
+)
+SMS_RECIPIENT_LIST_FIELDS = (
+    'id', 'job', 'residence', 'residence__name', 'residence__house_number',
+    'phone_number', 'status', 'error_message', 'sent_at',
+)
+
+# Seconds a job's status payload is served from cache; polling clients see
+# counters at most this stale. 0 disables the cache.
+DEFAULT_STATUS_CACHE_TIMEOUT = 2
+
+
+def _insert_recipients(job, model, contact_field, residences, contact):
+    """
+    Create a pending recipient for each residence with one INSERT ... SELECT,
+    copying the annotated `contact` into `contact_field`. The rows never pass
+    through Python. Returns the number inserted.
+    """
+    rows = residences.order_by().annotate(
+        recipient_job=Value(job.pk),
+        recipient_status=Value(model.Status.PENDING.value),
+        recipient_error=Value(''),
+    ).values_list('recipient_job', 'pk', contact, 'recipient_status', 'recipient_error')
+    select_sql, params = rows.query.sql_with_params()
+
+    qn = connection.ops.quote_name
+    columns = ', '.join(
+        qn(model._meta.get_field(name).column)
+        for name in ('job', 'residence', contact_field, 'status', 'error_message')
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(f'INSERT INTO {qn(model._meta.db_table)} ({columns}) {select_sql}', params)
+        return cursor.rowcount
+
+
+def _status_cache_key(pk):
+    return f'messaging:job-status:{pk}'
+
+
+def _status_etag(payload):
+    """Weak ETag that changes whenever the job's status or counters do."""
+    return 'W/"{status}-{email_sent_count}-{email_failed_count}-{sms_sent_count}-{sms_failed_count}"'.format(**payload)
+
+
+def _int_param(request, name, default, minimum):
+    """Read an integer query parameter, raising ValueError when it is invalid."""
+    value = request.query_params.get(name)
+    if value is None:
+        return default
+    try:
+        number = int(value)
+    except ValueError:
+        raise ValueError(f'{name} must be an integer.') from None
+    if number < minimum:
+        raise ValueError(f'{name} must be at least {minimum}.')
+    return number
+
+
+def _recipients_page(request, recipients, total_count, serializer_class):
+    """
+    Page through a job's recipients.
+    ?cursor=<last id> seeks past the previous page by primary key instead
+    of scanning an OFFSET; ?page=N still works for older clients. The total
+    is the job's stored counter, and an extra row is fetched to tell whether
+    another page exists, so neither mode runs COUNT().
+    """
+    page_size = RECIPIENTS_PAGE_SIZE
+    try:
+        cursor = _int_param(request, 'cursor', default=None, minimum=0)
+        page = _int_param(request, 'page', default=1, minimum=1)
+    except ValueError as e:
+        return Response({'detail': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    recipients = recipients.order_by('id')
+    if cursor is not None:
+        rows = list(recipients.filter(id__gt=cursor)[:page_size + 1])
+    else:
+        start = (page - 1) * page_size
+        rows = list(recipients[start:start + page_size + 1])
+
+    has_next = len(rows) > page_size
+    rows = rows[:page_size]
+
+    return Response({
+        'count': total_count,
+        'next': has_next,
+        'next_cursor': rows[-1].id if has_next else None,
+        'page': page,
+        'results': serializer_class(rows, many=True).data,
+    })
 
 
 class MessageJobViewSet(viewsets.ModelViewSet):
@@ -25,12 +157,20 @@ class MessageJobViewSet(viewsets.ModelViewSet):
     create: POST /api/v1/messaging/ (requires: add_messagejob)
     retrieve: GET /api/v1/messaging/{id}/ (requires: view_messagejob)
     """
-    queryset = MessageJob.objects.prefetch_related(
-        'email_recipients__residence',
-        'sms_recipients__residence'
-    )
+    # No recipient prefetch: the job serializers never render recipients,
+    # and the recipient actions page through them with their own queries
+    queryset = MessageJob.objects.all()
     permission_classes = [IsAuthenticated, MessageJobPermissions]
 
+    def get_queryset(self):
+        # The job serializers read progress from these annotations, and
+        # sender_email from the joined sender
+        queryset = super().get_queryset().annotate(**PROGRESS_ANNOTATIONS).select_related('sender')
+        if self.action == 'list':
+            # Skip the message bodies the list serializer never renders
+            queryset = queryset.defer('body', 'sms_body', 'error_message', 'started_at')
+        return queryset
+
     def get_serializer_class(self):
         if self.action == 'list':
             return MessageJobListSerializer
@@ -55,77 +195,56 @@ class MessageJobViewSet(viewsets.ModelViewSet):
         data = serializer.validated_data
         channels = data.get('channels', [Channel.EMAIL, Channel.SMS])
 
-        # Find residences with required contact info based on channels
-        email_residences = []
-        sms_residences = []
-
-        if Channel.EMAIL in channels:
-            email_residences = list(
-                Residence.objects.filter(
-                    email_addresses__isnull=False
-                ).distinct().prefetch_related('email_addresses')
+        # Create the job and copy in its recipients in one transaction. The
+        # totals are only known once the rows are in, so they are written
+        # with a single UPDATE at the end.
+        with transaction.atomic():
+            job = MessageJob.objects.create(
+                subject=data.get('subject', ''),
+                body=data['body'],
+                sms_body=data.get('sms_body', ''),
+                channels=channels,
+                sender=request.user,
             )
 
-        if Channel.SMS in channels:
-            sms_residences = list(
-                Residence.objects.filter(
-                    phone_numbers__isnull=False
-                ).distinct().prefetch_related('phone_numbers')
+            email_total = 0
+            sms_total = 0
+            if Channel.EMAIL in channels:
+                email_total = _insert_recipients(
+                    job, EmailRecipient, 'email_address',
+                    Residence.objects.with_primary_email(), 'primary_email',
+                )
+            if Channel.SMS in channels:
+                sms_total = _insert_recipients(
+                    job, SMSRecipient, 'phone_number',
+                    Residence.objects.with_primary_phone(), 'primary_phone',
+                )
+
+            # Validate that we have at least some recipients
+            if not email_total and not sms_total:
+                transaction.set_rollback(True)
+                return Response(
+                    {'detail': 'No residences with contact information found for the selected channels.'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+
+            job.email_total_recipients = email_total
+            job.sms_total_recipients = sms_total
+            job.total_recipients = email_total  # Legacy field
+            MessageJob.objects.filter(pk=job.pk).update(
+                email_total_recipients=email_total,
+                sms_total_recipients=sms_total,
+                total_recipients=email_total,
             )
 
-        # Validate that we have at least some recipients
-        if not email_residences and not sms_residences:
-            return Response(
-                {'detail': 'No residences with contact information found for the selected channels.'},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-
-        # Create the job
-        job = MessageJob.objects.create(
-            subject=data.get('subject', ''),
-            body=data['body'],
-            sms_body=data.get('sms_body', ''),
-            channels=channels,
-            sender=request.user,
-        )
+            # Start background processing only once the rows are committed,
+            # so the worker never looks for a job it cannot see yet
+            transaction.on_commit(partial(start_message_job, job.id))
 
-        # Create email recipients
-        email_recipients = []
-        for residence in email_residences:
-            email = get_recipient_email(residence)
-            if email:
-                email_recipients.append(EmailRecipient(
-                    job=job,
-                    residence=residence,
-                    email_address=email,
-                ))
-
-        if email_recipients:
-            EmailRecipient.objects.bulk_create(email_recipients)
-            job.email_total_recipients = len(email_recipients)
-            job.total_recipients = len(email_recipients)  # Legacy field
-
-        # Create SMS recipients
-        sms_recipients = []
-        for residence in sms_residences:
-            phone = get_recipient_phone(residence)
-            if phone:
-                sms_recipients.append(SMSRecipient(
-                    job=job,
-                    residence=residence,
-                    phone_number=phone,
-                ))
-
-        if sms_recipients:
-            SMSRecipient.objects.bulk_create(sms_recipients)
-            job.sms_total_recipients = len(sms_recipients)
-
-        job.save(update_fields=['email_total_recipients', 'sms_total_recipients', 'total_recipients'])
-
-        # Start background processing
-        start_message_job(job.id)
-
-        # Return job details
+        # Return job details from the instance we just saved; nothing has been
+        # processed yet, so every progress annotation is zero
+        for name in PROGRESS_ANNOTATIONS:
+            setattr(job, name, 0)
         response_serializer = MessageJobSerializer(job)
         return Response(response_serializer.data, status=status.HTTP_201_CREATED)
 
@@ -135,8 +254,26 @@ class MessageJobViewSet(viewsets.ModelViewSet):
         Get lightweight status update for a job (for polling).
         GET /api/v1/messaging/{id}/status/
         """
+        timeout = getattr(settings, 'MESSAGING_STATUS_CACHE_TIMEOUT', DEFAULT_STATUS_CACHE_TIMEOUT)
+        cache_key = _status_cache_key(pk)
+        payload = cache.get(cache_key) if timeout else None
+        if payload is None:
+            payload = self._status_payload()
+            if timeout:
+                cache.set(cache_key, payload, timeout)
+
+        # Let pollers revalidate: unchanged progress gets an empty 304
+        etag = _status_etag(payload)
+        headers = {'ETag': etag, 'Cache-Control': 'private, no-cache'}
+        if etag in parse_etags(request.headers.get('If-None-Match', '')):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        return Response(payload, headers=headers)
+
+    def _status_payload(self):
+        # Progress comes from the queryset annotations, computed in the same
+        # SELECT that loads the counters
         job = self.get_object()
-        return Response({
+        return {
             'id': job.id,
             'status': job.status,
             'channels': job.channels,
@@ -144,128 +281,100 @@ class MessageJobViewSet(viewsets.ModelViewSet):
             'email_total_recipients': job.email_total_recipients,
             'email_sent_count': job.email_sent_count,
             'email_failed_count': job.email_failed_count,
-            'email_progress_percent': (
-                int((job.email_sent_count + job.email_failed_count) / job.email_total_recipients * 100)
-                if job.email_total_recipients > 0 else 0
-            ),
+            'email_progress_percent': job.email_progress_percent,
             # SMS stats
             'sms_total_recipients': job.sms_total_recipients,
             'sms_sent_count': job.sms_sent_count,
             'sms_failed_count': job.sms_failed_count,
-            'sms_progress_percent': (
-                int((job.sms_sent_count + job.sms_failed_count) / job.sms_total_recipients * 100)
-                if job.sms_total_recipients > 0 else 0
-            ),
+            'sms_progress_percent': job.sms_progress_percent,
             # Overall
-            'overall_progress_percent': job.get_overall_progress(),
+            'overall_progress_percent': job.overall_progress_percent,
             # Legacy fields
             'total_recipients': job.total_recipients,
             'sent_count': job.sent_count,
             'failed_count': job.failed_count,
-            'progress_percent': (
-                int((job.sent_count + job.failed_count) / job.total_recipients * 100)
-                if job.total_recipients > 0 else 0
-            ),
-        })
+            'progress_percent': job.progress_percent,
+        }
 
     @action(detail=True, methods=['get'], url_path='email-recipients')
     def email_recipients(self, request, pk=None):
         """
         Get paginated email recipients for a job.
-        GET /api/v1/messaging/{id}/email-recipients/?page=1
+        GET /api/v1/messaging/{id}/email-recipients/?cursor=0 (or ?page=1)
         """
         job = self.get_object()
-        recipients = job.email_recipients.select_related('residence').all()
-
-        # Manual pagination
-        page = int(request.query_params.get('page', 1))
-        page_size = 10
-        start = (page - 1) * page_size
-        end = start + page_size
-
-        total_count = recipients.count()
-        paginated_recipients = recipients[start:end]
-
-        serializer = EmailRecipientSerializer(paginated_recipients, many=True)
-
-        return Response({
-            'count': total_count,
-            'next': page * page_size < total_count,
-            'page': page,
-            'results': serializer.data,
-        })
+        recipients = job.email_recipients.select_related('residence').only(*EMAIL_RECIPIENT_LIST_FIELDS)
+        return _recipients_page(request, recipients, job.email_total_recipients, EmailRecipientSerializer)
 
     @action(detail=True, methods=['get'], url_path='sms-recipients')
     def sms_recipients(self, request, pk=None):
         """
         Get paginated SMS recipients for a job.
-        GET /api/v1/messaging/{id}/sms-recipients/?page=1
+        GET /api/v1/messaging/{id}/sms-recipients/?cursor=0 (or ?page=1)
         """
         job = self.get_object()
-        recipients = job.sms_recipients.select_related('residence').all()
-
-        # Manual pagination
-        page = int(request.query_params.get('page', 1))
-        page_size = 10
-        start = (page - 1) * page_size
-        end = start + page_size
-
-        total_count = recipients.count()
-        paginated_recipients = recipients[start:end]
-
-        serializer = SMSRecipientSerializer(paginated_recipients, many=True)
-
-        return Response({
-            'count': total_count,
-            'next': page * page_size < total_count,
-            'page': page,
-            'results': serializer.data,
-        })
+        recipients = job.sms_recipients.select_related('residence').only(*SMS_RECIPIENT_LIST_FIELDS)
+        return _recipients_page(request, recipients, job.sms_total_recipients, SMSRecipientSerializer)
 
     # Legacy endpoint for backward compatibility
     @action(detail=True, methods=['get'])
     def recipients(self, request, pk=None):
         """
         Legacy endpoint - returns email recipients.
-        GET /api/v1/messaging/{id}/recipients/?page=1
+        GET /api/v1/messaging/{id}/recipients/?cursor=0 (or ?page=1)
         """
         return self.email_recipients(request, pk)
 
     @action(detail=True, methods=['post'])
     def retry(self, request, pk=None):
         """
-        Retry sending to failed recipients (both email and SMS).
+        Retry sending to failed recipients (both email and SMS), or re-queue
+        an unfinished job whose run was lost.
         POST /api/v1/messaging/{id}/retry/
         """
         job = self.get_object()
 
-        # Check if there are failed recipients
-        email_failed = job.email_recipients.filter(status=EmailRecipient.Status.FAILED).count()
-        sms_failed = job.sms_recipients.filter(status=SMSRecipient.Status.FAILED).count()
+        # Reset failed recipients to pending, along with any a dead run left
+        # claimed; the row counts tell us whether there was anything to retry,
+        # and a no-op UPDATE changes nothing
+        claimed_before = timezone.now() - STALE_SENDING_TIMEOUT
+        email_reset = job.email_recipients.filter(
+            Q(status=EmailRecipient.Status.FAILED)
+            | Q(status=EmailRecipient.Status.SENDING, sent_at__lt=claimed_before)
+        ).update(
+            status=EmailRecipient.Status.PENDING,
+            error_message='',
+            sent_at=None,
+        )
+        sms_reset = job.sms_recipients.filter(
+            Q(status=SMSRecipient.Status.FAILED)
+            | Q(status=SMSRecipient.Status.SENDING, sent_at__lt=claimed_before)
+        ).update(
+            status=SMSRecipient.Status.PENDING,
+            error_message='',
+            sent_at=None,
+        )
 
-        if email_failed == 0 and sms_failed == 0:
+        # A job whose run was lost with its process (the job queue is in
+        # memory) is still pending/processing with unsent recipients; queue
+        # it again. A second run beside a live one only takes rows no one
+        # else has claimed.
+        stranded = job.status in [MessageJob.Status.PENDING, MessageJob.Status.PROCESSING] and (
+            job.email_recipients.filter(status=EmailRecipient.Status.PENDING).exists()
+            or job.sms_recipients.filter(status=SMSRecipient.Status.PENDING).exists()
+        )
+
+        if email_reset == 0 and sms_reset == 0 and not stranded:
             return Response(
                 {'detail': 'No failed recipients to retry.'},
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        # Reset failed email recipients to pending
-        if email_failed > 0:
-            job.email_recipients.filter(status=EmailRecipient.Status.FAILED).update(
-                status=EmailRecipient.Status.PENDING,
-                error_message='',
-                sent_at=None,
-            )
+        if email_reset > 0:
             job.email_failed_count = 0
             job.failed_count = 0  # Legacy
 
-        # Reset failed SMS recipients to pending
-        if sms_failed > 0:
-            job.sms_recipients.filter(status=SMSRecipient.Status.FAILED).update(
-                status=SMSRecipient.Status.PENDING,
-                error_message='',
-                sent_at=None,
-            )
+        if sms_reset > 0:
             job.sms_failed_count = 0
 
         # Update job status
@@ -276,9 +385,13 @@ class MessageJobViewSet(viewsets.ModelViewSet):
             'email_failed_count', 'sms_failed_count', 'failed_count',
             'status', 'error_message', 'completed_at'
         ])
+        # Pollers served by this process see the reset counters right away.
+        # The default cache is per-process, so other workers' entries only
+        # clear when they expire, at most the status timeout later.
+        cache.delete(_status_cache_key(job.pk))
 
-        # Start background processing
-        start_message_job(job.id)
+        # Start background processing once the reset is committed
+        transaction.on_commit(partial(start_message_job, job.id))
 
         return Response({
             'id': job.id,
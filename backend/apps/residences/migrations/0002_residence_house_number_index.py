@@ -0,0 +1,18 @@
+# Generated by Django 5.2.9 on 2026-10-14 13:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('residences', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='residence',
+            name='house_number',
+            field=models.CharField(db_index=True, max_length=50),
+        ),
+    ]
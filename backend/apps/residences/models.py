@@ -1,14 +1,41 @@
 from django.db import models
+from django.db.models import OuterRef, Subquery
+
+
+def _primary_contact(model, field):
+    """Subquery for a residence's primary contact value, else its first one."""
+    return Subquery(
+        model.objects.filter(residence=OuterRef('pk'))
+        .order_by('-is_primary', 'pk')
+        .values(field)[:1]
+    )
+
+
+class ResidenceQuerySet(models.QuerySet):
+
+    def with_primary_email(self):
+        """Residences that have an email, annotated with the one to send to."""
+        return self.annotate(
+            primary_email=_primary_contact(EmailAddress, 'email')
+        ).filter(primary_email__isnull=False)
+
+    def with_primary_phone(self):
+        """Residences that have a phone number, annotated with the one to text."""
+        return self.annotate(
+            primary_phone=_primary_contact(PhoneNumber, 'number')
+        ).filter(primary_phone__isnull=False)
 
 
 class Residence(models.Model):
     """A residence/house with contact information."""
 
-    house_number = models.CharField(max_length=50)
+    house_number = models.CharField(max_length=50, db_index=True)
     name = models.CharField(max_length=255, help_text="Residence name (e.g., Mr. & Mrs. Mensah)")
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = ResidenceQuerySet.as_manager()
+
     class Meta:
         db_table = 'residences'
         ordering = ['house_number']
@@ -2,14 +2,54 @@ from rest_framework import serializers
 
 from .models import EmailAddress, PhoneNumber, Residence
 
+PHONE_FIELDS = ['number', 'label', 'is_primary']
+EMAIL_FIELDS = ['email', 'label', 'is_primary']
+
+
+def _sync_contacts(residence, related_name, model, items_data, fields):
+    """
+    Make a residence's contacts match items_data, writing only rows that differ.
+    Items are matched to existing rows by id; items without a known id reuse
+    leftover rows before new ones are inserted. Issues at most one INSERT,
+    one UPDATE and one DELETE.
+    """
+    unclaimed = {obj.pk: obj for obj in getattr(residence, related_name).all()}
+    claimed = [unclaimed.pop(item['id']) for item in items_data if item.get('id') in unclaimed]
+    spare = sorted(unclaimed.values(), key=lambda obj: obj.pk)
+    claimed_by_pk = {obj.pk: obj for obj in claimed}
+
+    to_create, to_update = [], []
+    for item in items_data:
+        values = {field: item[field] for field in fields if field in item}
+        obj = claimed_by_pk.pop(item.get('id'), None) or (spare.pop(0) if spare else None)
+        if obj is None:
+            to_create.append(model(residence=residence, **values))
+        elif any(getattr(obj, field) != value for field, value in values.items()):
+            for field, value in values.items():
+                setattr(obj, field, value)
+            to_update.append(obj)
+
+    if spare:
+        model.objects.filter(pk__in=[obj.pk for obj in spare]).delete()
+    if to_update:
+        model.objects.bulk_update(to_update, fields)
+    if to_create:
+        model.objects.bulk_create(to_create)
+
 
 class PhoneNumberSerializer(serializers.ModelSerializer):
+    # Writable so updates can match incoming rows to existing ones
+    id = serializers.IntegerField(required=False)
+
     class Meta:
         model = PhoneNumber
         fields = ['id', 'number', 'label', 'is_primary']
 
 
 class EmailAddressSerializer(serializers.ModelSerializer):
+    # Writable so updates can match incoming rows to existing ones
+    id = serializers.IntegerField(required=False)
+
     class Meta:
         model = EmailAddress
         fields = ['id', 'email', 'label', 'is_primary']
@@ -38,11 +78,15 @@ class ResidenceSerializer(serializers.ModelSerializer):
 
         residence = Residence.objects.create(**validated_data)
 
-        for phone_data in phone_numbers_data:
-            PhoneNumber.objects.create(residence=residence, **phone_data)
-
-        for email_data in email_addresses_data:
-            EmailAddress.objects.create(residence=residence, **email_data)
+        # Ids only matter when updating; new residences get new rows
+        PhoneNumber.objects.bulk_create([
+            PhoneNumber(residence=residence, **{f: d[f] for f in PHONE_FIELDS if f in d})
+            for d in phone_numbers_data
+        ])
+        EmailAddress.objects.bulk_create([
+            EmailAddress(residence=residence, **{f: d[f] for f in EMAIL_FIELDS if f in d})
+            for d in email_addresses_data
+        ])
 
         return residence
 
@@ -55,13 +99,9 @@ class ResidenceSerializer(serializers.ModelSerializer):
         instance.save()
 
         if phone_numbers_data is not None:
-            instance.phone_numbers.all().delete()
-            for phone_data in phone_numbers_data:
-                PhoneNumber.objects.create(residence=instance, **phone_data)
+            _sync_contacts(instance, 'phone_numbers', PhoneNumber, phone_numbers_data, PHONE_FIELDS)
 
         if email_addresses_data is not None:
-            instance.email_addresses.all().delete()
-            for email_data in email_addresses_data:
-                EmailAddress.objects.create(residence=instance, **email_data)
+            _sync_contacts(instance, 'email_addresses', EmailAddress, email_addresses_data, EMAIL_FIELDS)
 
         return instance
@@ -1,3 +1,81 @@
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 
-# Create your tests here.
+from .models import EmailAddress, PhoneNumber, Residence
+from .serializers import ResidenceSerializer
+
+
+class ResidenceContactSyncTests(TestCase):
+
+    def setUp(self):
+        self.residence = Residence.objects.create(house_number='H1', name='Mensah')
+        self.home = PhoneNumber.objects.create(residence=self.residence, number='0241111111', label='Home', is_primary=True)
+        self.work = PhoneNumber.objects.create(residence=self.residence, number='0242222222', label='Work')
+        self.email = EmailAddress.objects.create(residence=self.residence, email='mensah@example.com', is_primary=True)
+
+    def _update(self, **data):
+        serializer = ResidenceSerializer(self.residence, data=data, partial=True)
+        serializer.is_valid(raise_exception=True)
+        with CaptureQueriesContext(connection) as ctx:
+            serializer.save()
+        return [query['sql'] for query in ctx.captured_queries]
+
+    def _phones(self):
+        return list(self.residence.phone_numbers.order_by('pk').values_list('pk', 'number', 'label', 'is_primary'))
+
+    def test_rows_matched_by_id_are_updated_in_place(self):
+        self._update(phone_numbers=[
+            {'id': self.work.pk, 'number': '0242222222', 'label': 'Office', 'is_primary': True},
+            {'id': self.home.pk, 'number': '0241111111', 'label': 'Home', 'is_primary': False},
+        ])
+
+        self.assertEqual(self._phones(), [
+            (self.home.pk, '0241111111', 'Home', False),
+            (self.work.pk, '0242222222', 'Office', True),
+        ])
+
+    def test_new_items_reuse_leftover_rows(self):
+        self._update(phone_numbers=[
+            {'id': self.home.pk, 'number': '0241111111', 'label': 'Home', 'is_primary': True},
+            {'number': '0243333333', 'label': 'Mobile', 'is_primary': False},
+        ])
+
+        self.assertEqual(self._phones(), [
+            (self.home.pk, '0241111111', 'Home', True),
+            (self.work.pk, '0243333333', 'Mobile', False),
+        ])
+
+    def test_extra_rows_are_deleted_and_new_ones_inserted(self):
+        self._update(phone_numbers=[
+            {'id': self.work.pk, 'number': '0242222222', 'label': 'Work', 'is_primary': False},
+        ])
+        self.assertEqual(self._phones(), [(self.work.pk, '0242222222', 'Work', False)])
+
+        self._update(email_addresses=[
+            {'id': self.email.pk, 'email': 'mensah@example.com', 'label': '', 'is_primary': True},
+            {'email': 'work@example.com', 'label': 'Work', 'is_primary': False},
+        ])
+        self.assertEqual(
+            list(self.residence.email_addresses.order_by('pk').values_list('email', flat=True)),
+            ['mensah@example.com', 'work@example.com'],
+        )
+
+    def test_unchanged_contacts_are_not_written(self):
+        queries = self._update(phone_numbers=[
+            {'id': self.home.pk, 'number': '0241111111', 'label': 'Home', 'is_primary': True},
+            {'id': self.work.pk, 'number': '0242222222', 'label': 'Work', 'is_primary': False},
+        ])
+
+        phone_writes = [
+            sql for sql in queries
+            if 'residence_phone_numbers' in sql and not sql.startswith('SELECT')
+        ]
+        self.assertEqual(phone_writes, [])
+        self.assertEqual(len(self._phones()), 2)
+
+    def test_omitted_contacts_are_left_alone(self):
+        self._update(name='Mensah Family')
+
+        self.assertEqual(len(self._phones()), 2)
+        self.assertTrue(self.residence.email_addresses.filter(pk=self.email.pk).exists())
@@ -36,19 +36,23 @@ class ResidenceViewSet(viewsets.ModelViewSet):
         page = int(request.data.get('page', 1))
         page_size = 10
 
-        queryset = self.get_queryset()
+        # Filter and page over bare ids, then load full rows with their
+        # contacts by pk; DISTINCT across the phone join only sorts ids
+        matches = Residence.objects.all()
         if search:
-            queryset = queryset.filter(
+            matches = matches.filter(
                 Q(house_number__icontains=search) |
                 Q(name__icontains=search) |
                 Q(phone_numbers__number__icontains=search)
             ).distinct()
 
         # Manual pagination
-        total_count = queryset.count()
+        total_count = matches.values('pk').count()
         start = (page - 1) * page_size
         end = start + page_size
-        residences = queryset[start:end]
+        ordering = ('house_number', 'pk')
+        page_ids = list(matches.order_by(*ordering).values_list('pk', flat=True)[start:end])
+        residences = self.get_queryset().filter(pk__in=page_ids).order_by(*ordering)
 
         serializer = self.get_serializer(residences, many=True)
         return Response({
@@ -16,3 +16,11 @@ class UserSerializer(serializers.ModelSerializer):
         # Get all permissions (from user and groups)
         all_permissions = obj.get_all_permissions()
         return list(all_permissions)
+
+    def update(self, instance, validated_data):
+        """Write only the fields present in the request."""
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
+        if validated_data:
+            instance.save(update_fields=list(validated_data))
+        return instance
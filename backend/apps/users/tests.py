@@ -1,3 +1,106 @@
-from django.test import TestCase
+import time
+from unittest import mock
 
-# Create your tests here.
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from apps.messaging.models import MessageJob
+from apps.residences.models import EmailAddress, PhoneNumber, Residence
+
+from . import views
+from .models import User
+
+
+class DashboardViewTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(email='staff@example.com', username='staff', password='x')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+        both = Residence.objects.create(house_number='1', name='Both')
+        EmailAddress.objects.create(residence=both, email='a@example.com')
+        EmailAddress.objects.create(residence=both, email='b@example.com')
+        PhoneNumber.objects.create(residence=both, number='0241')
+        email_only = Residence.objects.create(house_number='2', name='Email only')
+        EmailAddress.objects.create(residence=email_only, email='c@example.com')
+        Residence.objects.create(house_number='3', name='None')
+
+        MessageJob.objects.create(
+            body='x', status=MessageJob.Status.COMPLETED,
+            email_sent_count=3, email_failed_count=1, sms_sent_count=2, sms_failed_count=0,
+        )
+        MessageJob.objects.create(body='y', status=MessageJob.Status.PROCESSING, email_sent_count=1)
+
+    def test_stats(self):
+        data = self.client.get('/api/v1/users/dashboard/').data
+
+        self.assertEqual(data['residences'], {'total': 3, 'with_email': 2, 'with_phone': 1})
+        self.assertEqual(data['messaging'], {
+            'total_jobs': 2, 'completed_jobs': 1,
+            'email_sent': 4, 'email_failed': 1, 'sms_sent': 2, 'sms_failed': 0,
+        })
+        self.assertEqual(data['emails'], {'total_jobs': 2, 'completed_jobs': 1, 'total_sent': 4, 'total_failed': 1})
+
+    def test_repeat_loads_are_served_from_cache(self):
+        first = self.client.get('/api/v1/users/dashboard/').data
+        Residence.objects.create(house_number='4', name='New')
+
+        with self.assertNumQueries(0):
+            second = self.client.get('/api/v1/users/dashboard/').data
+        self.assertEqual(second, first)
+
+    @override_settings(DASHBOARD_CACHE_TIMEOUT=0)
+    def test_cache_can_be_disabled(self):
+        self.client.get('/api/v1/users/dashboard/')
+        Residence.objects.create(house_number='4', name='New')
+
+        data = self.client.get('/api/v1/users/dashboard/').data
+        self.assertEqual(data['residences']['total'], 4)
+
+    def test_stale_stats_are_served_while_refreshing(self):
+        stale = views.dashboard_stats()
+        cache.set(views.DASHBOARD_CACHE_KEY, (stale, time.time() - 1), 60)
+        Residence.objects.create(house_number='4', name='New')
+        # Run the refresh on this thread; it closes its worker thread's
+        # connection, which here would be the test's own
+        executor = mock.Mock()
+        executor.submit.side_effect = lambda fn, *args: fn(*args)
+
+        with mock.patch.object(views, '_refresh_executor', executor), \
+                mock.patch.object(views, 'connection'):
+            data = self.client.get('/api/v1/users/dashboard/').data
+
+        self.assertEqual(data['residences']['total'], 3)
+        refreshed, stale_at = cache.get(views.DASHBOARD_CACHE_KEY)
+        self.assertEqual(refreshed['residences']['total'], 4)
+        self.assertGreater(stale_at, time.time())
+        self.assertIsNone(cache.get(views.DASHBOARD_REFRESH_LOCK_KEY))
+
+    def test_one_refresh_at_a_time(self):
+        cache.set(views.DASHBOARD_CACHE_KEY, (views.dashboard_stats(), time.time() - 1), 60)
+        cache.set(views.DASHBOARD_REFRESH_LOCK_KEY, True, 60)
+        executor = mock.Mock()
+
+        with mock.patch.object(views, '_refresh_executor', executor):
+            self.client.get('/api/v1/users/dashboard/')
+
+        executor.submit.assert_not_called()
+
+
+class CurrentUserViewTests(TestCase):
+
+    def test_patch_writes_only_changed_fields(self):
+        user = User.objects.create_user(email='me@example.com', username='me', password='x')
+        client = APIClient()
+        client.force_authenticate(user)
+
+        with mock.patch.object(User, 'save', autospec=True, side_effect=User.save) as save:
+            response = client.patch('/api/v1/users/me/', {'first_name': 'Ama'}, format='json')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(save.call_args.kwargs['update_fields'], ['first_name'])
+        user.refresh_from_db()
+        self.assertEqual(user.first_name, 'Ama')
@@ -1,4 +1,11 @@
-from django.db.models import Sum
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import Count, Exists, OuterRef, Q, Sum
 
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
@@ -6,10 +13,75 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from apps.messaging.models import MessageJob
-from apps.residences.models import Residence
+from apps.residences.models import EmailAddress, PhoneNumber, Residence
 
 from .serializers import UserSerializer
 
+logger = logging.getLogger(__name__)
+
+# Seconds dashboard stats are served from cache (0 disables the cache)
+DEFAULT_DASHBOARD_CACHE_TIMEOUT = 30
+# Seconds past that stale stats may still be served while a refresh runs
+DASHBOARD_STALE_TIMEOUT = 300
+DASHBOARD_CACHE_KEY = 'users:dashboard-stats:v2'
+DASHBOARD_REFRESH_LOCK_KEY = 'users:dashboard-stats:refreshing'
+
+# One background refresh at a time per process
+_refresh_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='dashboard-refresh')
+
+
+def dashboard_stats():
+    """Residence and messaging totals shown on the dashboard."""
+    # Residence stats in one scan; EXISTS avoids joining (and then
+    # de-duplicating) every residence against all of its contacts
+    residence_stats = Residence.objects.aggregate(
+        total=Count('pk'),
+        with_email=Count('pk', filter=Q(Exists(
+            EmailAddress.objects.filter(residence=OuterRef('pk'))
+        ))),
+        with_phone=Count('pk', filter=Q(Exists(
+            PhoneNumber.objects.filter(residence=OuterRef('pk'))
+        ))),
+    )
+    total_residences = residence_stats['total']
+    residences_with_email = residence_stats['with_email']
+    residences_with_phone = residence_stats['with_phone']
+
+    # Messaging stats
+    messaging_stats = MessageJob.objects.aggregate(
+        total_jobs=Count('pk'),
+        completed_jobs=Count('pk', filter=Q(status=MessageJob.Status.COMPLETED)),
+        email_total_sent=Sum('email_sent_count'),
+        email_total_failed=Sum('email_failed_count'),
+        sms_total_sent=Sum('sms_sent_count'),
+        sms_total_failed=Sum('sms_failed_count'),
+    )
+    total_message_jobs = messaging_stats['total_jobs']
+    completed_jobs = messaging_stats['completed_jobs']
+
+    return {
+        'residences': {
+            'total': total_residences,
+            'with_email': residences_with_email,
+            'with_phone': residences_with_phone,
+        },
+        'messaging': {
+            'total_jobs': total_message_jobs,
+            'completed_jobs': completed_jobs,
+            'email_sent': messaging_stats['email_total_sent'] or 0,
+            'email_failed': messaging_stats['email_total_failed'] or 0,
+            'sms_sent': messaging_stats['sms_total_sent'] or 0,
+            'sms_failed': messaging_stats['sms_total_failed'] or 0,
+        },
+        # Legacy field for backward compatibility
+        'emails': {
+            'total_jobs': total_message_jobs,
+            'completed_jobs': completed_jobs,
+            'total_sent': messaging_stats['email_total_sent'] or 0,
+            'total_failed': messaging_stats['email_total_failed'] or 0,
+        },
+    }
+
 
 class CurrentUserView(APIView):
     """
@@ -32,6 +104,24 @@ class CurrentUserView(APIView):
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
+def _cache_dashboard_stats(timeout):
+    """Compute the stats and cache them with the time they go stale."""
+    stats = dashboard_stats()
+    cache.set(DASHBOARD_CACHE_KEY, (stats, time.time() + timeout), timeout + DASHBOARD_STALE_TIMEOUT)
+    return stats
+
+
+def _refresh_dashboard_stats(timeout):
+    try:
+        _cache_dashboard_stats(timeout)
+    except Exception:
+        logger.exception("Dashboard stats refresh failed")
+    finally:
+        cache.delete(DASHBOARD_REFRESH_LOCK_KEY)
+        # The executor thread outlives the refresh; don't hold a DB connection
+        connection.close()
+
+
 class DashboardView(APIView):
     """
     Get dashboard statistics.
@@ -42,44 +132,19 @@ class DashboardView(APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
-        # Residence stats
-        total_residences = Residence.objects.count()
-        residences_with_email = Residence.objects.filter(
-            email_addresses__isnull=False
-        ).distinct().count()
-        residences_with_phone = Residence.objects.filter(
-            phone_numbers__isnull=False
-        ).distinct().count()
-
-        # Messaging stats
-        messaging_stats = MessageJob.objects.aggregate(
-            email_total_sent=Sum('email_sent_count'),
-            email_total_failed=Sum('email_failed_count'),
-            sms_total_sent=Sum('sms_sent_count'),
-            sms_total_failed=Sum('sms_failed_count'),
-        )
-        total_message_jobs = MessageJob.objects.count()
-        completed_jobs = MessageJob.objects.filter(status=MessageJob.Status.COMPLETED).count()
-
-        return Response({
-            'residences': {
-                'total': total_residences,
-                'with_email': residences_with_email,
-                'with_phone': residences_with_phone,
-            },
-            'messaging': {
-                'total_jobs': total_message_jobs,
-                'completed_jobs': completed_jobs,
-                'email_sent': messaging_stats['email_total_sent'] or 0,
-                'email_failed': messaging_stats['email_total_failed'] or 0,
-                'sms_sent': messaging_stats['sms_total_sent'] or 0,
-                'sms_failed': messaging_stats['sms_total_failed'] or 0,
-            },
-            # Legacy field for backward compatibility
-            'emails': {
-                'total_jobs': total_message_jobs,
-                'completed_jobs': completed_jobs,
-                'total_sent': messaging_stats['email_total_sent'] or 0,
-                'total_failed': messaging_stats['email_total_failed'] or 0,
-            },
-        })
+        # The stats are the same for every user and a little staleness is
+        # fine, so repeat loads within the timeout skip the aggregates
+        timeout = getattr(settings, 'DASHBOARD_CACHE_TIMEOUT', DEFAULT_DASHBOARD_CACHE_TIMEOUT)
+        if not timeout:
+            return Response(dashboard_stats())
+
+        cached = cache.get(DASHBOARD_CACHE_KEY)
+        if cached is None:
+            return Response(_cache_dashboard_stats(timeout))
+
+        # Once stale, serve the cached stats and recompute them in the
+        # background, so no request waits on the aggregates after expiry
+        stats, stale_at = cached
+        if time.time() >= stale_at and cache.add(DASHBOARD_REFRESH_LOCK_KEY, True, DASHBOARD_STALE_TIMEOUT):
+            _refresh_executor.submit(_refresh_dashboard_stats, timeout)
+        return Response(stats)
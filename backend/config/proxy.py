@@ -3,61 +3,112 @@ Proxy view to forward requests to Vite dev server.
 This allows running both Django and Vite through the same origin.
 """
 
+from functools import partial
+from urllib.parse import urlsplit
+
 import requests
 from django.conf import settings
 from django.http import HttpResponse, StreamingHttpResponse
+from requests.adapters import HTTPAdapter
 
 
 VITE_SERVER = getattr(settings, 'VITE_DEV_SERVER', 'http://localhost:5173')
+VITE_URL_PREFIX = VITE_SERVER.rstrip('/') + '/'
+VITE_HOST = urlsplit(VITE_SERVER).netloc
+
+# Methods whose request body is forwarded
+BODY_METHODS = frozenset({'POST', 'PUT', 'PATCH', 'DELETE'})
 
 # Headers to skip when proxying
-HOP_BY_HOP_HEADERS = {
+HOP_BY_HOP_HEADERS = frozenset({
     'connection', 'keep-alive', 'proxy-authenticate', 'proxy-authorization',
     'te', 'trailers', 'transfer-encoding', 'upgrade',
-}
+})
+# Upstream headers not copied back. requests has already decoded the body,
+# so its Content-Encoding no longer applies.
+SKIP_RESPONSE_HEADERS = HOP_BY_HOP_HEADERS | {'content-encoding'}
+
+# One keep-alive pool to Vite shared by every proxied request; the dev server
+# serves dozens of module requests per page load
+_session = requests.Session()
+_session.mount('http://', HTTPAdapter(pool_connections=1, pool_maxsize=32))
+_session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=32))
+
+
+class _RequestBody:
+    """
+    The incoming request body as an iterable of chunks with a known length, so
+    requests forwards it with the original Content-Length instead of reading
+    it all into memory first.
+    """
+
+    def __init__(self, request, length, chunk_size=64 * 1024):
+        self.request = request
+        self.length = length
+        self.chunk_size = chunk_size
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        return iter(partial(self.request.read, self.chunk_size), b'')
+
+
+def _request_body(request):
+    if request.method not in BODY_METHODS:
+        return None
+    try:
+        length = int(request.META.get('CONTENT_LENGTH') or 0)
+    except ValueError:
+        length = 0
+    return _RequestBody(request, length) if length > 0 else None
+
+
+def _stream(resp, chunk_size=8192):
+    """Yield the upstream body, handing the connection back to the pool when done."""
+    try:
+        yield from resp.iter_content(chunk_size=chunk_size)
+    finally:
+        resp.close()
 
 
 def proxy_to_vite(request, path=''):
     """Proxy request to Vite dev server."""
-    url = f"{VITE_SERVER}/{path}"
+    url = VITE_URL_PREFIX + path
+    # Pass the query string through as-is rather than parsing and re-encoding it
+    query_string = request.META.get('QUERY_STRING')
+    if query_string:
+        url += '?' + query_string
 
     # Build headers, excluding hop-by-hop headers
-    headers = {}
-    for key, value in request.headers.items():
-        if key.lower() not in HOP_BY_HOP_HEADERS:
-            headers[key] = value
-
-    # Update host header
-    headers['Host'] = VITE_SERVER.replace('http://', '').replace('https://', '')
+    headers = {
+        key: value for key, value in request.headers.items()
+        if key.lower() not in HOP_BY_HOP_HEADERS
+    }
+    headers['Host'] = VITE_HOST
 
     try:
         # Forward the request to Vite
-        resp = requests.request(
+        resp = _session.request(
             method=request.method,
             url=url,
             headers=headers,
-            data=request.body if request.method in ('POST', 'PUT', 'PATCH') else None,
-            params=request.GET,
+            data=_request_body(request),
             allow_redirects=False,
             stream=True,
             timeout=30,
         )
 
-        # Build response headers
-        response_headers = {}
-        for key, value in resp.headers.items():
-            if key.lower() not in HOP_BY_HOP_HEADERS and key.lower() != 'content-encoding':
-                response_headers[key] = value
-
         # Stream the response
         response = StreamingHttpResponse(
-            resp.iter_content(chunk_size=8192),
+            _stream(resp),
             status=resp.status_code,
             content_type=resp.headers.get('Content-Type', 'text/html'),
         )
 
-        for key, value in response_headers.items():
-            response[key] = value
+        for key, value in resp.headers.items():
+            if key.lower() not in SKIP_RESPONSE_HEADERS:
+                response[key] = value
 
         return response
 
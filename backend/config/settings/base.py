@@ -167,15 +167,13 @@ SIMPLE_JWT = {
 }
 
 # CORS Settings
-CORS_ALLOWED_ORIGINS = [
+# Add ngrok or other origins from environment, dropping duplicates
+EXTRA_CORS_ORIGINS = os.environ.get('CORS_ALLOWED_ORIGINS', '')
+CORS_ALLOWED_ORIGINS = list(dict.fromkeys([
     'http://localhost:5173',
     'http://127.0.0.1:5173',
-]
-
-# Add ngrok or other origins from environment
-EXTRA_CORS_ORIGINS = os.environ.get('CORS_ALLOWED_ORIGINS', '')
-if EXTRA_CORS_ORIGINS:
-    CORS_ALLOWED_ORIGINS.extend([origin.strip() for origin in EXTRA_CORS_ORIGINS.split(',') if origin.strip()])
+    *filter(None, (origin.strip() for origin in EXTRA_CORS_ORIGINS.split(','))),
+]))
 
 CORS_ALLOW_CREDENTIALS = True
 
@@ -208,10 +206,22 @@ DEFAULT_FROM_EMAIL_DISPLAY_NAME = os.environ.get('DEFAULT_FROM_EMAIL_DISPLAY_NAM
 # Email batch processing settings
 EMAIL_BATCH_SIZE = int(os.environ.get('EMAIL_BATCH_SIZE', 50))
 EMAIL_BATCH_DELAY = float(os.environ.get('EMAIL_BATCH_DELAY', 1.0))  # seconds between batches
+EMAIL_RPS = float(os.environ.get('EMAIL_RPS', 0))  # max sends/second; 0 = batch size / batch delay
+EMAIL_CONCURRENCY = int(os.environ.get('EMAIL_CONCURRENCY', 4))  # parallel SMTP sessions per job
 
 # SMS batch processing settings
 SMS_BATCH_SIZE = int(os.environ.get('SMS_BATCH_SIZE', 50))
 SMS_BATCH_DELAY = float(os.environ.get('SMS_BATCH_DELAY', 1.0))  # seconds between batches
+SMS_RPS = float(os.environ.get('SMS_RPS', 0))  # max messages/second; 0 = batch size / batch delay
+
+# Message jobs processed concurrently per process (each runs its channels in parallel)
+MESSAGING_WORKERS = int(os.environ.get('MESSAGING_WORKERS', 2))
+
+# Seconds a job's polled status is cached (0 = always read the database)
+MESSAGING_STATUS_CACHE_TIMEOUT = int(os.environ.get('MESSAGING_STATUS_CACHE_TIMEOUT', 2))
+
+# Seconds dashboard stats are cached (0 = recompute on every request)
+DASHBOARD_CACHE_TIMEOUT = int(os.environ.get('DASHBOARD_CACHE_TIMEOUT', 30))
 
 # MNotify SMS settings (used by MNotifyBackend)
 MNOTIFY_API_KEY = os.environ.get('MNOTIFY_API_KEY', '')
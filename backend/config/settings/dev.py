@@ -4,15 +4,13 @@ from .base import *  # noqa
 
 DEBUG = True
 
-ALLOWED_HOSTS = [
+# Add extra hosts from environment (e.g., ngrok URLs), dropping duplicates
+EXTRA_ALLOWED_HOSTS = os.environ.get('ALLOWED_HOSTS', '')
+ALLOWED_HOSTS = list(dict.fromkeys([
     'localhost',
     '127.0.0.1',
-]
-
-# Add extra hosts from environment (e.g., ngrok URLs)
-EXTRA_ALLOWED_HOSTS = os.environ.get('ALLOWED_HOSTS', '')
-if EXTRA_ALLOWED_HOSTS:
-    ALLOWED_HOSTS.extend([host.strip() for host in EXTRA_ALLOWED_HOSTS.split(',') if host.strip()])
+    *filter(None, (host.strip() for host in EXTRA_ALLOWED_HOSTS.split(','))),
+]))
 
 # Database
 DATABASES = {
@@ -23,6 +21,9 @@ DATABASES = {
         'PASSWORD': os.environ.get('DB_PASSWORD'),
         'HOST': os.environ.get('DB_HOST', 'localhost'),
         'PORT': os.environ.get('DB_PORT', '5432'),
+        # Reuse connections across requests; health checks drop dead ones first
+        'CONN_MAX_AGE': int(os.environ.get('CONN_MAX_AGE', 600)),
+        'CONN_HEALTH_CHECKS': True,
     }
 }
 
@@ -6,18 +6,17 @@ from .base import *  # noqa
 
 DEBUG = False
 
-# Allowed hosts from environment
-ALLOWED_HOSTS = [
-    host.strip()
-    for host in os.environ.get('ALLOWED_HOSTS', '').split(',')
-    if host.strip()
-]
+# Allowed hosts from environment, without duplicates
+ALLOWED_HOSTS = list(dict.fromkeys(
+    filter(None, (host.strip() for host in os.environ.get('ALLOWED_HOSTS', '').split(',')))
+))
 
 # Database
 DATABASES = {
     'default': dj_database_url.config(
         default=os.environ.get('DATABASE_URL'),
         conn_max_age=600,
+        conn_health_checks=True,
         ssl_require=True,
     ),
 }
@@ -32,11 +31,9 @@ SECURE_HSTS_INCLUDE_SUBDOMAINS = True
 SECURE_HSTS_PRELOAD = True
 
 # CORS settings for production
-CORS_ALLOWED_ORIGINS = [
-    origin.strip()
-    for origin in os.environ.get('CORS_ALLOWED_ORIGINS', '').split(',')
-    if origin.strip()
-]
+CORS_ALLOWED_ORIGINS = list(dict.fromkeys(
+    filter(None, (origin.strip() for origin in os.environ.get('CORS_ALLOWED_ORIGINS', '').split(',')))
+))
 
 # SMS backend for production (MNotify)
 SMS_BACKEND = 'apps.messaging.sms_backends.MNotifyBackend'
\ No newline at end of file
@@ -1,12 +1,55 @@
 """
 SPA (Single Page Application) serving for production.
 Serves the React frontend built files.
+
+Precompressed copies next to a file (app.js.br, app.js.gz, e.g. from
+`python -m whitenoise.compress staticfiles/frontend`) are served to clients
+that accept them.
 """
 
-from django.conf import settings
-from django.http import HttpResponse, Http404
+import hashlib
+import re
+from functools import lru_cache
 from pathlib import Path
 
+from django.conf import settings
+from django.http import FileResponse, HttpResponse, HttpResponseNotModified, Http404
+from django.utils.cache import patch_vary_headers
+from django.utils.http import parse_etags
+
+# Build output never changes while the process runs (deploys restart it), so
+# small files are kept in memory; larger ones are streamed from disk
+MAX_CACHED_ASSET_SIZE = 1024 * 1024
+
+# Vite emits content-hashed filenames under assets/, which can be cached forever
+HASHED_ASSETS_PREFIX = 'assets/'
+
+# Sidecar suffix for each content coding, in order of preference
+PRECOMPRESSED_SUFFIXES = (
+    ('br', '.br'),
+    ('gzip', '.gz'),
+)
+ACCEPT_ENCODING_RES = {
+    encoding: re.compile(rf'\b{encoding}\b') for encoding, _ in PRECOMPRESSED_SUFFIXES
+}
+
+CONTENT_TYPES = {
+    '.html': 'text/html',
+    '.css': 'text/css',
+    '.js': 'application/javascript',
+    '.json': 'application/json',
+    '.png': 'image/png',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.gif': 'image/gif',
+    '.svg': 'image/svg+xml',
+    '.ico': 'image/x-icon',
+    '.woff': 'font/woff',
+    '.woff2': 'font/woff2',
+    '.ttf': 'font/ttf',
+    '.eot': 'application/vnd.ms-fontobject',
+}
+
 
 def serve_spa(request, path=''):
     """
@@ -14,48 +57,85 @@ def serve_spa(request, path=''):
     This enables client-side routing to work properly.
     """
     # Path to the frontend build directory
-    frontend_dir = Path(settings.STATIC_ROOT) / 'frontend'
+    frontend_dir = (Path(settings.STATIC_ROOT) / 'frontend').resolve()
 
     # Try to serve the exact file if it exists (for assets like JS, CSS)
     if path:
-        file_path = frontend_dir / path
-        if file_path.is_file():
-            content_type = _get_content_type(path)
-            return HttpResponse(
-                file_path.read_bytes(),
-                content_type=content_type,
-            )
+        file_path = (frontend_dir / path).resolve()
+        # Never serve anything outside the build directory (e.g. via "..")
+        if file_path.is_relative_to(frontend_dir) and file_path.is_file():
+            return _file_response(request, file_path, immutable=path.startswith(HASHED_ASSETS_PREFIX))
 
     # Otherwise serve index.html (for SPA client-side routing)
     index_path = frontend_dir / 'index.html'
     if index_path.exists():
-        return HttpResponse(
-            index_path.read_text(),
-            content_type='text/html',
-        )
+        return _file_response(request, index_path, immutable=False)
 
     raise Http404("Frontend not found. Run the build process first.")
 
 
+def _file_response(request, file_path, immutable):
+    """
+    Respond with a build file, or 304 if the client's copy is current.
+    Hashed assets may be cached for a year; everything else is revalidated.
+    """
+    content_type = _get_content_type(file_path.name)
+    encoding, file_path = _negotiate_encoding(request, file_path)
+
+    stat = file_path.stat()
+    content = None
+    if stat.st_size <= MAX_CACHED_ASSET_SIZE:
+        content, etag = _read_asset(str(file_path))
+    else:
+        # Too big to hash per request; version it like a static file server
+        etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+
+    if etag in parse_etags(request.headers.get('If-None-Match', '')):
+        response = HttpResponseNotModified()
+    elif content is not None:
+        response = HttpResponse(content, content_type=content_type)
+    else:
+        # Let the WSGI server send the file itself (sendfile via
+        # wsgi.file_wrapper) instead of copying it through Python
+        response = FileResponse(file_path.open('rb'), content_type=content_type)
+    if encoding and response.status_code == 200:
+        response['Content-Encoding'] = encoding
+    patch_vary_headers(response, ('Accept-Encoding',))
+    response['ETag'] = etag
+    response['Cache-Control'] = 'public, max-age=31536000, immutable' if immutable else 'no-cache'
+    return response
+
+
+def _negotiate_encoding(request, file_path):
+    """Pick the best precompressed copy of a file the client accepts."""
+    accept_encoding = request.headers.get('Accept-Encoding', '')
+    for encoding, path in _precompressed(str(file_path)):
+        if ACCEPT_ENCODING_RES[encoding].search(accept_encoding):
+            return encoding, path
+    return None, file_path
+
+
+@lru_cache(maxsize=256)
+def _precompressed(path: str) -> tuple[tuple[str, Path], ...]:
+    """Precompressed siblings of a build file, looked up once per process."""
+    return tuple(
+        (encoding, Path(path + suffix))
+        for encoding, suffix in PRECOMPRESSED_SUFFIXES
+        if Path(path + suffix).is_file()
+    )
+
+
+@lru_cache(maxsize=256)
+def _read_asset(path: str) -> tuple[bytes, str]:
+    """File bytes and ETag, read from disk once per process."""
+    content = Path(path).read_bytes()
+    return content, _etag(content)
+
+
+def _etag(content: bytes) -> str:
+    return f'"{hashlib.md5(content, usedforsecurity=False).hexdigest()}"'
+
+
 def _get_content_type(path: str) -> str:
     """Get content type based on file extension."""
-    extension_map = {
-        '.html': 'text/html',
-        '.css': 'text/css',
-        '.js': 'application/javascript',
-        '.json': 'application/json',
-        '.png': 'image/png',
-        '.jpg': 'image/jpeg',
-        '.jpeg': 'image/jpeg',
-        '.gif': 'image/gif',
-        '.svg': 'image/svg+xml',
-        '.ico': 'image/x-icon',
-        '.woff': 'font/woff',
-        '.woff2': 'font/woff2',
-        '.ttf': 'font/ttf',
-        '.eot': 'application/vnd.ms-fontobject',
-    }
-    for ext, content_type in extension_map.items():
-        if path.endswith(ext):
-            return content_type
-    return 'application/octet-stream'
+    return CONTENT_TYPES.get(Path(path).suffix.lower(), 'application/octet-stream')
@@ -6,8 +6,10 @@ bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
 # Workers - default to 2 for containerized environments (Railway, etc.)
 # multiprocessing.cpu_count() returns host CPU count, not container allocation
 workers = int(os.environ.get('WEB_CONCURRENCY', 2))
-worker_class = 'sync'
-worker_connections = 1000
+# Threaded workers overlap I/O-bound requests (DB round-trips, the Vite proxy).
+# Each thread keeps its own DB connection, so plan for workers * threads.
+worker_class = 'gthread'
+threads = int(os.environ.get('GUNICORN_THREADS', 8))
 timeout = 30
 keepalive = 2
 
@@ -121,14 +121,16 @@ export interface EmailAddress {
   is_primary: boolean;
 }
 
-// Input types for create/update operations (without id fields)
+// Input types for create/update operations (id set when editing an existing row)
 export interface PhoneNumberInput {
+  id?: number;
   number: string;
   label: string;
   is_primary: boolean;
 }
 
 export interface EmailAddressInput {
+  id?: number;
   email: string;
   label: string;
   is_primary: boolean;
@@ -202,7 +204,7 @@ export interface EmailRecipient {
   residence_name: string;
   house_number: string;
   email_address: string;
-  status: 'pending' | 'sent' | 'failed';
+  status: 'pending' | 'sending' | 'sent' | 'failed';
   error_message: string;
   sent_at: string | null;
 }
@@ -214,7 +216,7 @@ export interface SMSRecipient {
   residence_name: string;
   house_number: string;
   phone_number: string;
-  status: 'pending' | 'sent' | 'failed';
+  status: 'pending' | 'sending' | 'sent' | 'failed';
   error_message: string;
   sent_at: string | null;
 }
@@ -258,6 +260,7 @@ export type EmailJob = MessageJob;
 export interface RecipientsResponse<T> {
   count: number;
   next: boolean;
+  next_cursor: number | null;
   page: number;
   results: T[];
 }
@@ -351,12 +354,12 @@ export async function createMessageJob(data: MessageJobInput): Promise<MessageJo
   });
 }
 
-export async function getMessageJobEmailRecipients(jobId: number, page = 1): Promise<EmailRecipientsResponse> {
-  return apiFetch<EmailRecipientsResponse>(`/messaging/${jobId}/email-recipients/?page=${page}`);
+export async function getMessageJobEmailRecipients(jobId: number, cursor: number | null = null): Promise<EmailRecipientsResponse> {
+  return apiFetch<EmailRecipientsResponse>(`/messaging/${jobId}/email-recipients/?cursor=${cursor ?? 0}`);
 }
 
-export async function getMessageJobSMSRecipients(jobId: number, page = 1): Promise<SMSRecipientsResponse> {
-  return apiFetch<SMSRecipientsResponse>(`/messaging/${jobId}/sms-recipients/?page=${page}`);
+export async function getMessageJobSMSRecipients(jobId: number, cursor: number | null = null): Promise<SMSRecipientsResponse> {
+  return apiFetch<SMSRecipientsResponse>(`/messaging/${jobId}/sms-recipients/?cursor=${cursor ?? 0}`);
 }
 
 export async function retryMessageJob(jobId: number): Promise<MessageJobStatus> {
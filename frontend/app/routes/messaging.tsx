@@ -104,8 +104,8 @@ export default function Messaging() {
   const [detailTab, setDetailTab] = useState(0);
   const [emailRecipients, setEmailRecipients] = useState<EmailRecipient[]>([]);
   const [smsRecipients, setSmsRecipients] = useState<SMSRecipient[]>([]);
-  const [emailRecipientsPage, setEmailRecipientsPage] = useState(1);
-  const [smsRecipientsPage, setSmsRecipientsPage] = useState(1);
+  const [emailRecipientsCursor, setEmailRecipientsCursor] = useState<number | null>(null);
+  const [smsRecipientsCursor, setSmsRecipientsCursor] = useState<number | null>(null);
   const [hasMoreEmailRecipients, setHasMoreEmailRecipients] = useState(false);
   const [hasMoreSmsRecipients, setHasMoreSmsRecipients] = useState(false);
   const [loadingMoreRecipients, setLoadingMoreRecipients] = useState(false);
@@ -299,8 +299,8 @@ export default function Messaging() {
     setDetailTab(0);
     setEmailRecipients([]);
     setSmsRecipients([]);
-    setEmailRecipientsPage(1);
-    setSmsRecipientsPage(1);
+    setEmailRecipientsCursor(null);
+    setSmsRecipientsCursor(null);
     setHasMoreEmailRecipients(false);
     setHasMoreSmsRecipients(false);
     try {
@@ -311,16 +311,18 @@ export default function Messaging() {
       const promises: Promise<void>[] = [];
       if (job.channels.includes('email')) {
         promises.push(
-          getMessageJobEmailRecipients(jobId, 1).then(data => {
+          getMessageJobEmailRecipients(jobId).then(data => {
             setEmailRecipients(data.results);
+            setEmailRecipientsCursor(data.next_cursor);
             setHasMoreEmailRecipients(data.next);
           })
         );
       }
       if (job.channels.includes('sms')) {
         promises.push(
-          getMessageJobSMSRecipients(jobId, 1).then(data => {
+          getMessageJobSMSRecipients(jobId).then(data => {
             setSmsRecipients(data.results);
+            setSmsRecipientsCursor(data.next_cursor);
             setHasMoreSmsRecipients(data.next);
           })
         );
@@ -338,10 +340,9 @@ export default function Messaging() {
     if (!detailJob || loadingMoreRecipients) return;
     setLoadingMoreRecipients(true);
     try {
-      const nextPage = emailRecipientsPage + 1;
-      const data = await getMessageJobEmailRecipients(detailJob.id, nextPage);
+      const data = await getMessageJobEmailRecipients(detailJob.id, emailRecipientsCursor);
       setEmailRecipients((prev) => [...prev, ...data.results]);
-      setEmailRecipientsPage(nextPage);
+      setEmailRecipientsCursor(data.next_cursor);
       setHasMoreEmailRecipients(data.next);
     } catch (err) {
       setSnackbar({ open: true, message: 'Failed to load more recipients', severity: 'error' });
@@ -354,10 +355,9 @@ export default function Messaging() {
     if (!detailJob || loadingMoreRecipients) return;
     setLoadingMoreRecipients(true);
     try {
-      const nextPage = smsRecipientsPage + 1;
-      const data = await getMessageJobSMSRecipients(detailJob.id, nextPage);
+      const data = await getMessageJobSMSRecipients(detailJob.id, smsRecipientsCursor);
       setSmsRecipients((prev) => [...prev, ...data.results]);
-      setSmsRecipientsPage(nextPage);
+      setSmsRecipientsCursor(data.next_cursor);
       setHasMoreSmsRecipients(data.next);
     } catch (err) {
       setSnackbar({ open: true, message: 'Failed to load more recipients', severity: 'error' });
@@ -375,8 +375,8 @@ export default function Messaging() {
     setDetailJob(null);
     setEmailRecipients([]);
     setSmsRecipients([]);
-    setEmailRecipientsPage(1);
-    setSmsRecipientsPage(1);
+    setEmailRecipientsCursor(null);
+    setSmsRecipientsCursor(null);
     setHasMoreEmailRecipients(false);
     setHasMoreSmsRecipients(false);
     setRetryProgress(null);
@@ -404,16 +404,16 @@ export default function Messaging() {
       setRetrying(false);
       // Refresh recipients to show updated statuses
       if (detailJob.channels.includes('email')) {
-        getMessageJobEmailRecipients(detailJob.id, 1).then((data) => {
+        getMessageJobEmailRecipients(detailJob.id).then((data) => {
           setEmailRecipients(data.results);
-          setEmailRecipientsPage(1);
+          setEmailRecipientsCursor(data.next_cursor);
           setHasMoreEmailRecipients(data.next);
         });
       }
       if (detailJob.channels.includes('sms')) {
-        getMessageJobSMSRecipients(detailJob.id, 1).then((data) => {
+        getMessageJobSMSRecipients(detailJob.id).then((data) => {
           setSmsRecipients(data.results);
-          setSmsRecipientsPage(1);
+          setSmsRecipientsCursor(data.next_cursor);
           setHasMoreSmsRecipients(data.next);
         });
       }
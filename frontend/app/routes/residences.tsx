@@ -196,6 +196,7 @@ export default function Residences() {
     setPhoneNumbers(
       residence.phone_numbers.length > 0
         ? residence.phone_numbers.map((p) => ({
+            id: p.id,
             number: p.number,
             label: p.label,
             is_primary: p.is_primary,
@@ -205,6 +206,7 @@ export default function Residences() {
     setEmailAddresses(
       residence.email_addresses.length > 0
         ? residence.email_addresses.map((e) => ({
+            id: e.id,
             email: e.email,
             label: e.label,
             is_primary: e.is_primary,